@@ -0,0 +1,48 @@
+"""Partial indexes for the segment claim query
+
+Revision ID: 061
+Revises: 060
+Create Date: 2026-10-15
+
+Every idle worker polls GET /segments/next, which selects the oldest pending segment of a
+pending/processing job, ordered by job priority then segment age, FOR UPDATE SKIP LOCKED. The
+only candidates were ix_segments_status (every status, so it mostly indexes finished work) and a
+full ix_jobs_priority — so each poll scanned completed history before it could lock anything.
+
+Both indexes are partial on exactly the statuses the claim filters on, which keeps them the size
+of the live queue rather than of all history. Built CONCURRENTLY so the deploy does not block
+claims while it runs; that cannot happen inside a transaction, hence the autocommit block.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "061"
+down_revision = "060"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_segments_pending_created",
+            "segments",
+            ["created_at"],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_jobs_priority_active",
+            "jobs",
+            ["priority"],
+            postgresql_where=sa.text("status IN ('pending', 'processing')"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_jobs_priority_active", table_name="jobs", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_segments_pending_created", table_name="segments", postgresql_concurrently=True, if_exists=True)
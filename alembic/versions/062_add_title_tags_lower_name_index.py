@@ -0,0 +1,25 @@
+"""Add expression index on lower(title_tags.name)
+
+Revision ID: 062
+Revises: 061
+Create Date: 2026-10-15
+
+create_tag rejects duplicates case-insensitively with lower(name) = :name AND "group" = :group.
+uq_title_tags_name_group is on the raw name, so it cannot serve that predicate and every create
+scanned the table.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "062"
+down_revision = "061"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_title_tags_lower_name", "title_tags", [sa.text("lower(name)"), "group"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_title_tags_lower_name", table_name="title_tags")
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
@@ -15,6 +16,14 @@ from app.models import User
 security = HTTPBearer()
 api_key_header = APIKeyHeader(name="X-API-Key")
 
+# The signing key, prepared once. Given the raw secret, pyjwt looks up the algorithm and
+# re-validates the key (PEM/SSH pattern checks) on every call - and decode runs on every
+# authenticated request. A PyJWK carries the already-prepared key and pins HS256.
+_JWT_KEY = jwt.PyJWK(
+    {"kty": "oct", "k": jwt.utils.base64url_encode(settings.jwt_secret.encode()).decode()},
+    algorithm="HS256",
+)
+
 
 async def verify_api_key(key: str = Depends(api_key_header)):
     if not settings.api_key or key != settings.api_key:
@@ -79,17 +88,27 @@ def verify_password(password: str, password_hash: str) -> bool:
     return bcrypt.checkpw(password.encode(), password_hash.encode())
 
 
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    """verify_password off the event loop.
+
+    A bcrypt check is deliberately slow (~250ms at the default cost) and would stall every
+    other request on the loop for that long. bcrypt releases the GIL while hashing, so a
+    worker thread runs it in parallel with the loop - no process pool needed.
+    """
+    return await asyncio.to_thread(verify_password, password, password_hash)
+
+
 def create_access_token(user_id: UUID) -> str:
     payload = {
         "sub": str(user_id),
         "exp": datetime.now(timezone.utc) + timedelta(hours=settings.jwt_expiry_hours),
     }
-    return jwt.encode(payload, settings.jwt_secret, algorithm="HS256")
+    return jwt.encode(payload, _JWT_KEY, algorithm="HS256")
 
 
 def decode_access_token(token: str) -> UUID:
     try:
-        payload = jwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=["HS256"])
         return UUID(payload["sub"])
     except (jwt.InvalidTokenError, KeyError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
@@ -44,3 +44,14 @@ JOB_VALID_TRANSITIONS: dict[str, set[str]] = {
     JobStatus.PAUSED: {JobStatus.PENDING, JobStatus.PROCESSING, JobStatus.AWAITING, JobStatus.ARCHIVED},
     JobStatus.ARCHIVED: {JobStatus.AWAITING},
 }
+
+# The same rules flattened to (current, target) pairs, so a check is one hash lookup. A
+# per-status bitmask would still need a dict lookup to turn each status string into a bit.
+_JOB_TRANSITION_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (current, target) for current, targets in JOB_VALID_TRANSITIONS.items() for target in targets
+)
+
+
+def is_job_transition_allowed(current: str, target: str) -> bool:
+    """Whether a user may move a job from `current` to `target` (PATCH /jobs/{id})."""
+    return (current, target) in _JOB_TRANSITION_PAIRS
@@ -1,12 +1,18 @@
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from typing import get_args
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from app import s3
 from app.config import settings
 from app.heartbeat_monitor import heartbeat_monitor
 from app.reservation_monitor import reservation_monitor
@@ -16,8 +22,40 @@ from app.routes import app_settings, auth, faceswap, favorites, files, images, j
 logger = logging.getLogger(__name__)
 
 
+def _response_models(tp) -> set[type[BaseModel]]:
+    """Every BaseModel named in a response_model annotation, looking inside list[...]/unions."""
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return {tp}
+    found: set[type[BaseModel]] = set()
+    for arg in get_args(tp):
+        found |= _response_models(arg)
+    return found
+
+
+def build_route_schemas(app: FastAPI) -> None:
+    """Build the deferred validators for the response models the mounted routes use.
+
+    The schema modules set defer_build so importing them costs nothing; this pays for the
+    models a request can actually reach once, at startup, instead of on the first request
+    that happens to touch each one. Models no route returns are never built.
+    """
+    models: set[type[BaseModel]] = set()
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.response_model is not None:
+            models |= _response_models(route.response_model)
+    for model in models:
+        model.model_rebuild(force=False)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=s3.IO_THREADS, thread_name_prefix="io")
+    )
+    # Building a boto3 client loads its service model from disk (~100ms). Do it once here
+    # rather than inside whichever request happens to be first.
+    await asyncio.to_thread(s3._get_client)
+    build_route_schemas(app)
     tasks = [
         asyncio.create_task(heartbeat_monitor()),
         asyncio.create_task(reservation_monitor()),
@@ -32,7 +70,9 @@ async def lifespan(app: FastAPI):
             pass
 
 
-app = FastAPI(title="wanly-api", lifespan=lifespan)
+# Responses are rendered by orjson: the job detail payload is hundreds of nested segment
+# dicts, and the stdlib encoder walks every one of them in Python.
+app = FastAPI(title="wanly-api", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # --- Rate limiting -----------------------------------------------------------
 app.state.limiter = limiter
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import BigInteger, Boolean, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -30,6 +30,8 @@ class Job(Base):
         Index("ix_jobs_status", "status"),
         Index("ix_jobs_priority", "priority"),
         Index("ix_jobs_starting_image", "starting_image"),
+        # Claim query: only claimable jobs, ordered by priority (migration 061).
+        Index("ix_jobs_priority_active", "priority", postgresql_where=text("status IN ('pending', 'processing')")),
     )
 
     id = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -103,6 +105,8 @@ class Segment(Base):
         UniqueConstraint("job_id", "index", name="uq_segments_job_index"),
         Index("ix_segments_job_id", "job_id"),
         Index("ix_segments_status", "status"),
+        # Claim query: the pending queue in FIFO order (migration 061).
+        Index("ix_segments_pending_created", "created_at", postgresql_where=text("status = 'pending'")),
     )
 
     id = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -248,6 +252,8 @@ class TitleTag(Base):
     __tablename__ = "title_tags"
     __table_args__ = (
         Index("ix_title_tags_group", "group"),
+        # Backs create_tag's case-insensitive duplicate check (migration 062).
+        Index("ix_title_tags_lower_name", text("lower(name)"), "group"),
         UniqueConstraint("name", "group", name="uq_title_tags_name_group"),
     )
 
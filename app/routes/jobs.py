@@ -8,7 +8,7 @@ from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Query, UploadFile, status
-from sqlalchemy import case, func, select
+from sqlalchemy import case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -17,7 +17,7 @@ from sqlalchemy import or_
 from app.auth import get_current_user
 from app.config import settings
 from app.database import get_db
-from app.enums import JOB_VALID_TRANSITIONS, JobStatus, SegmentStatus, VideoStatus
+from app.enums import JobStatus, SegmentStatus, VideoStatus, is_job_transition_allowed
 from app.estimation import estimate_segment_time, get_estimation_rates, sum_estimated_queue_time
 from app.helpers import upload_faceswap_image
 from app.models import Job, Lora, Segment, User, Video
@@ -37,6 +37,7 @@ def _starting_image_key(user_id: UUID, image_hash: str, ext: str) -> str:
     return f"users/{user_id}/starting_images/{image_hash}{ext}"
 from app.schemas.jobs import IdentityAggregate, JobCreate, JobDetailResponse, JobListResponse, JobReorderRequest, JobResponse, JobUpdate, StatsResponse, WorkerStatsItem
 from app.schemas.segments import SegmentResponse
+from app.schemas.videos import VideoResponse
 from app.stitch import stitch_video
 
 import logging
@@ -480,26 +481,27 @@ async def reorder_jobs(
     if not body.job_ids:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="job_ids must not be empty")
 
-    # Fetch all referenced jobs, verify they belong to the user
+    # Assign priority 0, 1, 2, ... based on array position, in one UPDATE that also enforces
+    # ownership. RETURNING hands back the stored rows (updated_at included), so there is no
+    # SELECT before and no refresh per job after.
     result = await db.execute(
-        select(Job).where(Job.id.in_(body.job_ids), Job.user_id == user.id)
+        update(Job)
+        .where(Job.id.in_(body.job_ids), Job.user_id == user.id)
+        .values(priority=case({job_id: i for i, job_id in enumerate(body.job_ids)}, value=Job.id))
+        .returning(Job)
+        .execution_options(synchronize_session=False, populate_existing=True)
     )
     jobs_by_id = {job.id: job for job in result.scalars().all()}
 
+    # Fewer rows than ids: some are missing, not the user's, or listed twice. Raising before
+    # the commit discards the UPDATE when get_db closes the session.
     if len(jobs_by_id) != len(body.job_ids):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Some job IDs not found or not owned by you")
 
-    # Assign priority 0, 1, 2, ... based on array position
-    for i, job_id in enumerate(body.job_ids):
-        jobs_by_id[job_id].priority = i
-
     await db.commit()
 
     # Return in priority order
-    ordered = [jobs_by_id[jid] for jid in body.job_ids]
-    for job in ordered:
-        await db.refresh(job)
-    return ordered
+    return [JobResponse.from_orm_trusted(jobs_by_id[jid]) for jid in body.job_ids]
 
 
 @router.get("/jobs/{job_id}", response_model=JobDetailResponse)
@@ -532,7 +534,7 @@ async def get_job(
     if active_segs:
         rates = await get_estimation_rates(db, user.id)
         for s in segments:
-            sr = SegmentResponse.model_validate(s)
+            sr = SegmentResponse.from_orm_trusted(s)
             if s.status in (SegmentStatus.PENDING, SegmentStatus.CLAIMED, SegmentStatus.PROCESSING):
                 est = estimate_segment_time(
                     rates, job.width, job.height, job.fps,
@@ -543,7 +545,7 @@ async def get_job(
                     job_est = est
             seg_responses.append(sr)
     else:
-        seg_responses = [SegmentResponse.model_validate(s) for s in segments]
+        seg_responses = [SegmentResponse.from_orm_trusted(s) for s in segments]
 
     return JobDetailResponse(
         identity=_identity_aggregate(job.segments),
@@ -589,7 +591,7 @@ async def get_job(
         created_at=job.created_at,
         updated_at=job.updated_at,
         segments=seg_responses,
-        videos=job.videos,
+        videos=[VideoResponse.from_orm_trusted(v) for v in job.videos],
         segment_count=len(segments),
         completed_segment_count=len(completed),
         total_run_time=total_run_time,
@@ -625,8 +627,7 @@ async def update_job(
         job.video_preset_id = body.video_preset_id
 
     if body.status is not None:
-        allowed = JOB_VALID_TRANSITIONS.get(job.status, set())
-        if body.status not in allowed:
+        if not is_job_transition_allowed(job.status, body.status):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Cannot transition from '{job.status}' to '{body.status}'",
@@ -691,7 +692,7 @@ async def reopen_job(
     if active_segs:
         rates = await get_estimation_rates(db, user.id)
         for s in segments:
-            sr = SegmentResponse.model_validate(s)
+            sr = SegmentResponse.from_orm_trusted(s)
             if s.status in (SegmentStatus.PENDING, SegmentStatus.CLAIMED, SegmentStatus.PROCESSING):
                 est = estimate_segment_time(
                     rates, job.width, job.height, job.fps,
@@ -702,7 +703,7 @@ async def reopen_job(
                     job_est = est
             seg_responses.append(sr)
     else:
-        seg_responses = [SegmentResponse.model_validate(s) for s in segments]
+        seg_responses = [SegmentResponse.from_orm_trusted(s) for s in segments]
 
     return JobDetailResponse(
         identity=_identity_aggregate(job.segments),
@@ -735,7 +736,7 @@ async def reopen_job(
         tags=job.tags,
         estimated_run_time=job_est,
         created_at=job.created_at, updated_at=job.updated_at,
-        segments=seg_responses, videos=job.videos,
+        segments=seg_responses, videos=[VideoResponse.from_orm_trusted(v) for v in job.videos],
         segment_count=len(segments), completed_segment_count=len(completed),
         total_run_time=total_run_time, total_video_time=total_video_time,
     )
@@ -824,38 +825,29 @@ async def get_stats(
     ).all()
     jobs_by_status = {row[0]: row[1] for row in job_rows}
 
-    # Segments grouped by status (join through jobs for user scoping)
-    seg_rows = (
-        await db.execute(
-            select(Segment.status, func.count())
-            .join(Job, Segment.job_id == Job.id)
-            .where(Job.user_id == user.id)
-            .group_by(Segment.status)
-        )
-    ).all()
-    segments_by_status = {row[0]: row[1] for row in seg_rows}
-
-    # Avg run time over a rolling window, not all of history. A lifetime average barely
-    # moves once there are thousands of segments behind it, so it stops reflecting how the
-    # current models, settings and workers are actually performing.
+    # Segments grouped by status (join through jobs for user scoping), plus the average run
+    # time from the same scan: the FILTERed avg of the completed group is the windowed average.
+    # The window is rolling, not all of history. A lifetime average barely moves once there
+    # are thousands of segments behind it, so it stops reflecting how the current models,
+    # settings and workers are actually performing.
     cutoff = datetime.now(timezone.utc) - timedelta(hours=STATS_WINDOW_HOURS)
-    avg_run_time = (
+    seg_rows = (
         await db.execute(
             select(
+                Segment.status,
+                func.count(),
                 func.avg(
                     func.extract("epoch", Segment.completed_at)
                     - func.extract("epoch", Segment.claimed_at)
-                )
+                ).filter(Segment.claimed_at.isnot(None), Segment.completed_at >= cutoff),
             )
             .join(Job, Segment.job_id == Job.id)
-            .where(
-                Job.user_id == user.id,
-                Segment.status == SegmentStatus.COMPLETED,
-                Segment.claimed_at.isnot(None),
-                Segment.completed_at >= cutoff,
-            )
+            .where(Job.user_id == user.id)
+            .group_by(Segment.status)
         )
-    ).scalar_one_or_none()
+    ).all()
+    segments_by_status = {row[0]: row[1] for row in seg_rows}
+    avg_run_time = next((row[2] for row in seg_rows if row[0] == SegmentStatus.COMPLETED), None)
     avg_run_time = round(avg_run_time, 1) if avg_run_time is not None else None
 
     # Work still outstanding, priced with the same estimator the job queue uses so the two
@@ -879,7 +871,8 @@ async def get_stats(
         rates = await get_estimation_rates(db, user.id)
         total_queue_time = sum_estimated_queue_time(rates, queue_rows)
 
-    # Worker stats
+    # Worker stats. Averaged per worker by Postgres, so only one row per worker comes back
+    # however many segments each has run - there is no per-segment loop here to speed up.
     worker_rows = (
         await db.execute(
             select(
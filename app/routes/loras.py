@@ -196,7 +196,7 @@ async def list_loras(
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(select(Lora).order_by(Lora.created_at.desc()))
-    return result.scalars().all()
+    return [LoraListItem.from_orm_trusted(lora) for lora in result.scalars()]
 
 
 @router.get("/loras/{lora_id}", response_model=LoraResponse)
@@ -208,7 +208,7 @@ async def get_lora(
     lora = await db.get(Lora, lora_id)
     if lora is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="LoRA not found")
-    return lora
+    return LoraResponse.from_orm_trusted(lora)
 
 
 @router.post("/loras", response_model=LoraResponse, status_code=status.HTTP_201_CREATED)
@@ -6,21 +6,25 @@ import random
 import re
 import subprocess
 import tempfile
+import time
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Query, UploadFile, status
-from sqlalchemy import or_, select, text
+from sqlalchemy import Row, exists, func, or_, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app import wildcard_cache
 from app.auth import get_current_user, verify_api_key, verify_api_key_or_bearer
 from app.database import get_db
 from app.enums import JobStatus, SegmentStatus, VideoStatus
 from app.helpers import upload_faceswap_image
 from app.models import AppSetting, Job, Lora, Segment, User, Video, VideoSettingsPreset, Wildcard, Worker
 from app.s3 import delete_object, download_file, move_object, parse_s3_uri
+from app.schemas.orm import list_adapter
 from app.schemas.segments import (
     FramePreview,
     FramePreviewResponse,
@@ -59,38 +63,108 @@ SMASHCUT_CARRIER_INDEX = 2000
 # Reprocess types that run on the CPU-only track (no ComfyUI/GPU): holograms + smashcut concat.
 _CPU_REPROCESS_TYPES = ("ar_hologram", "smashcut_concat")
 
+# A <name> placeholder in a prompt. Wildcard names are free text (spaces, hyphens, dots), so
+# anything but another angle bracket counts - not just \w.
+_WILDCARD_RE = re.compile(r"<([^<>]+)>")
+
+# The spellings of a lora_id UUID() accepts. Checked first so a malformed id is a 400 naming
+# it, not a ValueError out of the resolver.
+_UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$")
+
+
 router = APIRouter()
 
 
-async def _resolve_loras(db: AsyncSession, loras_input: list | None) -> list | None:
-    """Resolve lora_id references to full file info for daemon consumption."""
-    if not loras_input:
-        return loras_input
-    resolved = []
+def _lora_refs(loras_input: list) -> dict[str, UUID]:
+    """The library LoRA ids a segment's loras list references, each string parsed once."""
+    refs = {}
     for item in loras_input:
-        if not isinstance(item, dict):
-            resolved.append(item)
+        if not isinstance(item, dict) or not (ref := item.get("lora_id")):
             continue
-        lora_id = item.get("lora_id")
-        if lora_id:
-            lora = await db.get(Lora, UUID(lora_id))
-            if lora is None:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"LoRA not found: {lora_id}",
-                )
-            resolved.append({
-                "lora_id": str(lora.id),
-                "high_file": lora.high_file,
-                "high_s3_uri": lora.high_s3_uri,
-                "high_weight": item.get("high_weight", lora.default_high_weight),
-                "low_file": lora.low_file,
-                "low_s3_uri": lora.low_s3_uri,
-                "low_weight": item.get("low_weight", lora.default_low_weight),
-            })
-        else:
+        if not isinstance(ref, str) or not _UUID_RE.match(ref):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid lora_id: {ref}",
+            )
+        if ref not in refs:
+            refs[ref] = UUID(ref)
+    return refs
+
+
+def _build_lora_entries(loras_input: list, loras_by_ref: dict[str, Row]) -> list:
+    """Expand lora_id references from loras_by_ref; any other entry passes through unchanged."""
+    resolved = []
+    for item in loras_input:
+        # Raw filename strings raise TypeError, manual dicts KeyError; both pass through.
+        try:
+            lora_id = item["lora_id"]
+        except (TypeError, KeyError):
+            lora_id = None
+        if not lora_id:
             # Backward compat: raw filename format
             resolved.append(item)
+            continue
+        lora = loras_by_ref.get(lora_id)
+        if lora is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"LoRA not found: {lora_id}",
+            )
+        resolved.append({
+            "lora_id": str(lora.id),
+            "high_file": lora.high_file,
+            "high_s3_uri": lora.high_s3_uri,
+            "high_weight": item.get("high_weight", lora.default_high_weight),
+            "low_file": lora.low_file,
+            "low_s3_uri": lora.low_s3_uri,
+            "low_weight": item.get("low_weight", lora.default_low_weight),
+        })
+    return resolved
+
+
+async def _resolve_loras(db: AsyncSession, loras_input: list | None) -> list | None:
+    """Resolve lora_id references to full file info for daemon consumption.
+
+    When nothing needs resolving the input list itself is returned, not a copy, so callers
+    must treat the result as read-only.
+    """
+    if not loras_input:
+        return loras_input
+    refs = _lora_refs(loras_input)
+    # Most segments reference no library LoRA at all; hand those back without rebuilding.
+    if not refs:
+        return loras_input
+    # One IN query for every referenced LoRA rather than a db.get per entry, and only the
+    # columns the entries carry: plain rows, no ORM instances to hydrate and track.
+    result = await db.execute(
+        select(
+            Lora.id,
+            Lora.high_file,
+            Lora.high_s3_uri,
+            Lora.low_file,
+            Lora.low_s3_uri,
+            Lora.default_high_weight,
+            Lora.default_low_weight,
+        ).where(Lora.id.in_(set(refs.values())))
+    )
+    loras_by_id = {lora.id: lora for lora in result.all()}
+    loras_by_ref = {ref: loras_by_id[lora_id] for ref, lora_id in refs.items() if lora_id in loras_by_id}
+    return _build_lora_entries(loras_input, loras_by_ref)
+
+
+def _substitute_wildcards(prompt: str, options_by_name: dict[str, Sequence[str]]) -> str:
+    """Replace each <name> with one random option of that wildcard, the same one everywhere.
+
+    Names missing from options_by_name, or with no options, stay in the prompt as typed.
+    """
+    # Draw every name first, then substitute: one choice per name however often it appears.
+    # The module-level random.choice is already a bound method of one shared generator; a fresh
+    # random.Random() per call would reseed from os.urandom each time.
+    choose = random.choice
+    selections = {name: choose(options) for name, options in options_by_name.items() if options}
+    resolved = prompt
+    for name, chosen in selections.items():
+        resolved = resolved.replace(f"<{name}>", chosen)
     return resolved
 
 
@@ -100,28 +174,30 @@ async def _resolve_wildcards(db: AsyncSession, prompt: str) -> tuple[str, str |
     Returns (resolved_prompt, template_or_none).
     If no wildcards found, returns (prompt, None).
     """
-    pattern = re.compile(r"<([^<>]+)>")
-    matches = pattern.findall(prompt)
-    if not matches:
+    # Most prompts have no placeholder. A bare '<' check is a memchr, cheaper than entering the
+    # regex engine; the search then rules out stray brackets without building a list.
+    if "<" not in prompt or _WILDCARD_RE.search(prompt) is None:
         return prompt, None
 
-    # Fetch all referenced wildcards in one query
-    unique_names = list(set(matches))
-    result = await db.execute(
-        select(Wildcard).where(Wildcard.name.in_(unique_names))
-    )
-    wildcards_by_name = {w.name: w for w in result.scalars().all()}
+    now = time.monotonic()
+    options_by_name = {}
+    misses = []
+    for name in set(_WILDCARD_RE.findall(prompt)):
+        cached = wildcard_cache.get_options(name, now)
+        if cached is not None:
+            options_by_name[name] = cached
+        else:
+            misses.append(name)
 
-    template = prompt
-    resolved = prompt
-    for name in unique_names:
-        wc = wildcards_by_name.get(name)
-        if wc and wc.options:
-            # Replace all occurrences of this wildcard
-            chosen = random.choice(wc.options)
-            resolved = resolved.replace(f"<{name}>", chosen)
+    if misses:
+        # Fetch every uncached wildcard in one query, an index probe per name through the
+        # unique constraint on wildcards.name. Names with no row are not cached: they come from
+        # free-typed prompts, so caching them would grow without bound.
+        result = await db.execute(select(Wildcard).where(Wildcard.name.in_(misses)))
+        for w in result.scalars().all():
+            options_by_name[w.name] = wildcard_cache.store_options(w.name, w.options, now)
 
-    return resolved, template
+    return _substitute_wildcards(prompt, options_by_name), prompt
 
 
 @router.get("/segments", response_model=list[WorkerSegmentResponse], dependencies=[Depends(verify_api_key_or_bearer)])
@@ -130,29 +206,27 @@ async def list_segments(
     limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
+    # Only the columns the response carries: full Segment rows would drag progress_log, loras
+    # and the identity metrics JSON across the wire for up to 200 rows and then discard them.
     result = await db.execute(
-        select(Segment, Job.name)
+        select(
+            Segment.id,
+            Segment.job_id,
+            Job.name.label("job_name"),
+            Segment.index,
+            Segment.prompt,
+            Segment.status,
+            Segment.duration_seconds,
+            Segment.created_at,
+            Segment.claimed_at,
+            Segment.completed_at,
+        )
         .join(Job, Segment.job_id == Job.id)
         .where(Segment.worker_id == worker_id)
         .order_by(Segment.completed_at.desc().nullslast(), Segment.created_at.desc())
         .limit(limit)
     )
-    rows = result.all()
-    return [
-        WorkerSegmentResponse(
-            id=seg.id,
-            job_id=seg.job_id,
-            job_name=job_name,
-            index=seg.index,
-            prompt=seg.prompt,
-            status=seg.status,
-            duration_seconds=seg.duration_seconds,
-            created_at=seg.created_at,
-            claimed_at=seg.claimed_at,
-            completed_at=seg.completed_at,
-        )
-        for seg, job_name in rows
-    ]
+    return list_adapter(WorkerSegmentResponse).validate_python(result.mappings().all())
 
 
 @router.post("/jobs/{job_id}/segments", response_model=SegmentResponse, status_code=status.HTTP_201_CREATED)
@@ -178,6 +252,8 @@ async def add_segment(
 
     next_index = max((s.index for s in job.segments), default=-1) + 1
 
+    # Sequential on purpose: both run on the request's one AsyncSession, which cannot carry two
+    # statements at once, and each is at most a single small IN query.
     resolved_loras = await _resolve_loras(db, body.loras)
     resolved_prompt, prompt_template = await _resolve_wildcards(db, body.prompt)
 
@@ -214,8 +290,9 @@ async def add_segment(
 
     job.status = JobStatus.PENDING
 
+    # No refresh: every Segment column is either assigned above or has a Python-side default,
+    # and the session does not expire on commit, so the instance already matches the row.
     await db.commit()
-    await db.refresh(segment)
     return segment
 
 
@@ -423,7 +500,6 @@ async def claim_next_segment(
         hologram_source_path = holo_video.output_path if holo_video else None
 
     await db.commit()
-    await db.refresh(segment)
 
     is_smashcut = segment.reprocess_type == "smashcut_concat"
     smashcut_clip_paths = segment.smashcut_clip_paths if is_smashcut else None
@@ -512,56 +588,32 @@ async def update_segment(
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
-    segment = await db.get(Segment, segment_id)
+    # Write only what the daemon sent: one UPDATE whose SET clause lists the touched columns,
+    # RETURNING the row for the response. Every SegmentStatusUpdate field is a Segment column
+    # of the same name, and None means "not sent" — progress PATCHes carry one or two fields.
+    changes = body.model_dump(exclude_none=True)
+    if body.status in (SegmentStatus.COMPLETED, SegmentStatus.FAILED):
+        # First terminal status wins; a repeated PATCH must not move the finish time.
+        changes["completed_at"] = func.coalesce(Segment.completed_at, datetime.now(timezone.utc))
+    if changes:
+        segment = (
+            await db.execute(
+                update(Segment)
+                .where(Segment.id == segment_id)
+                .values(**changes)
+                .returning(Segment)
+                # The row may already be in this session's identity map; RETURNING must win.
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+        ).scalar_one_or_none()
+    else:
+        segment = await db.get(Segment, segment_id)
     if segment is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Segment not found")
 
-    if body.status is not None:
-        segment.status = body.status
-        if body.status in (SegmentStatus.COMPLETED, SegmentStatus.FAILED) and segment.completed_at is None:
-            segment.completed_at = datetime.now(timezone.utc)
-    if body.output_path is not None:
-        segment.output_path = body.output_path
-    if body.last_frame_path is not None:
-        segment.last_frame_path = body.last_frame_path
-    if body.error_message is not None:
-        segment.error_message = body.error_message
-    if body.progress_log is not None:
-        segment.progress_log = body.progress_log
-    if body.motion_keywords is not None:
-        segment.motion_keywords = body.motion_keywords
-    if body.motion_magnitude is not None:
-        segment.motion_magnitude = body.motion_magnitude
-    # Identity scores measured by the daemon at generation time. Measurement only -
-    # never gates status, exactly like motion_magnitude and the Lynx QA scores.
-    if body.identity_mean_cos is not None:
-        segment.identity_mean_cos = body.identity_mean_cos
-    if body.identity_mean_cos_ref is not None:
-        segment.identity_mean_cos_ref = body.identity_mean_cos_ref
-    if body.identity_min_cos is not None:
-        segment.identity_min_cos = body.identity_min_cos
-    if body.identity_slope is not None:
-        segment.identity_slope = body.identity_slope
-    if body.identity_frames is not None:
-        segment.identity_frames = body.identity_frames
-    if body.identity_no_face is not None:
-        segment.identity_no_face = body.identity_no_face
-    if body.identity_face_px_p50 is not None:
-        segment.identity_face_px_p50 = body.identity_face_px_p50
-    if body.identity_yaw_max is not None:
-        segment.identity_yaw_max = body.identity_yaw_max
-    if body.identity_metrics is not None:
-        segment.identity_metrics = body.identity_metrics
-    if body.identity_start_cos_ref is not None:
-        segment.identity_start_cos_ref = body.identity_start_cos_ref
-    if body.identity_end_cos_ref is not None:
-        segment.identity_end_cos_ref = body.identity_end_cos_ref
-    if body.vace_overlap_seconds is not None:
-        segment.vace_overlap_seconds = body.vace_overlap_seconds
     if body.lynx_identity_scores is not None:
         # Identity QA is measurement only — persisted so the ip/ref calibration can be
         # argued from numbers later. Never affects segment status.
-        segment.lynx_identity_scores = body.lynx_identity_scores
         logger.info(
             "segment %s lynx identity QA: mean=%s min=%s max=%s (%s/%s frames with a face)",
             segment.id,
@@ -572,33 +624,38 @@ async def update_segment(
             body.lynx_identity_scores.get("frames_sampled"),
         )
 
-    await db.flush()
-
     # Check if job needs status update. Hologram carriers are exempt — they don't affect the
     # source job's status (a failed hologram must not flip a finalized job to FAILED).
     if body.status in (SegmentStatus.COMPLETED, SegmentStatus.FAILED) and segment.reprocess_type != "ar_hologram":
-        job = await db.get(Job, segment.job_id)
-        result = await db.execute(
-            select(Segment).where(
-                Segment.job_id == job.id,
-                Segment.status.in_([SegmentStatus.PENDING, SegmentStatus.CLAIMED, SegmentStatus.PROCESSING]),
-            )
+        finalize = segment.auto_finalize and body.status == SegmentStatus.COMPLETED
+        if finalize:
+            new_job_status = JobStatus.FINALIZED
+        elif body.status == SegmentStatus.FAILED:
+            new_job_status = JobStatus.FAILED
+        else:
+            new_job_status = JobStatus.AWAITING
+        # The job only moves once nothing is left queued or running. Deciding that inside the
+        # UPDATE's own WHERE saves reading the active segments back just to count them.
+        still_active = exists().where(
+            Segment.job_id == Job.id,
+            Segment.status.in_([SegmentStatus.PENDING, SegmentStatus.CLAIMED, SegmentStatus.PROCESSING]),
         )
-        active_segments = result.scalars().all()
-        if len(active_segments) == 0:
-            if segment.auto_finalize and body.status == SegmentStatus.COMPLETED:
-                job.status = JobStatus.FINALIZED
-                video = Video(job_id=job.id, status=VideoStatus.PENDING, tags=job.tags)
-                db.add(video)
-                await db.flush()
-                background_tasks.add_task(stitch_video, video.id, job.id)
-            elif body.status == SegmentStatus.FAILED:
-                job.status = JobStatus.FAILED
-            else:
-                job.status = JobStatus.AWAITING
+        job_row = (
+            await db.execute(
+                update(Job)
+                .where(Job.id == segment.job_id, ~still_active)
+                .values(status=new_job_status)
+                .returning(Job.tags)
+                .execution_options(synchronize_session=False)
+            )
+        ).one_or_none()
+        if job_row is not None and finalize:
+            video = Video(job_id=segment.job_id, status=VideoStatus.PENDING, tags=job_row.tags)
+            db.add(video)
+            await db.flush()
+            background_tasks.add_task(stitch_video, video.id, segment.job_id)
 
     await db.commit()
-    await db.refresh(segment)
     return segment
 
 
@@ -803,7 +860,6 @@ async def retry_segment(
     job.status = JobStatus.PENDING
 
     await db.commit()
-    await db.refresh(segment)
     return segment
 
 
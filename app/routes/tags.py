@@ -37,14 +37,16 @@ async def create_tag(
     if not name:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Tag name cannot be empty")
 
-    # Case-insensitive duplicate check
-    existing = await db.execute(
-        select(TitleTag).where(
+    # Case-insensitive duplicate check (served by ix_title_tags_lower_name)
+    existing_id = await db.scalar(
+        select(TitleTag.id)
+        .where(
             func.lower(TitleTag.name) == name.lower(),
             TitleTag.group == body.group,
         )
+        .limit(1)
     )
-    if existing.scalars().first():
+    if existing_id is not None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Tag already exists in this group")
 
     tag = TitleTag(name=name, group=body.group)
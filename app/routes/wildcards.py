@@ -1,24 +1,38 @@
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import wildcard_cache
 from app.auth import get_current_user
 from app.database import get_db
 from app.models import User, Wildcard
-from app.schemas.wildcards import WildcardCreate, WildcardResponse, WildcardUpdate
+from app.schemas.orm import list_adapter
+from app.schemas.wildcards import WildcardCreate, WildcardNameResponse, WildcardResponse, WildcardUpdate
 
 router = APIRouter()
 
 
-@router.get("/wildcards", response_model=list[WildcardResponse])
+@router.get("/wildcards", response_model=list[WildcardResponse] | list[WildcardNameResponse])
 async def list_wildcards(
+    # No limit by default: existing callers expect the whole list and have no next-page signal.
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    names_only: bool = Query(False, description="Return only id + name, without options"),
     user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Wildcard).order_by(Wildcard.name))
-    return result.scalars().all()
+    # Each branch builds its own model explicitly, so the union response_model never has to
+    # guess which shape a row is.
+    if names_only:
+        result = await db.execute(
+            select(Wildcard.id, Wildcard.name).order_by(Wildcard.name).limit(limit).offset(offset)
+        )
+        return list_adapter(WildcardNameResponse).validate_python(result.mappings().all())
+    result = await db.execute(select(Wildcard).order_by(Wildcard.name).limit(limit).offset(offset))
+    return list_adapter(WildcardResponse).validate_python(result.scalars().all())
 
 
 @router.post("/wildcards", response_model=WildcardResponse, status_code=status.HTTP_201_CREATED)
@@ -36,6 +50,7 @@ async def create_wildcard(
     wildcard = Wildcard(name=body.name, options=body.options)
     db.add(wildcard)
     await db.commit()
+    wildcard_cache.clear()
     await db.refresh(wildcard)
     return wildcard
 
@@ -67,6 +82,7 @@ async def update_wildcard(
     if body.options is not None:
         wildcard.options = body.options
     await db.commit()
+    wildcard_cache.clear()
     await db.refresh(wildcard)
     return wildcard
 
@@ -82,3 +98,4 @@ async def delete_wildcard(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Wildcard not found")
     await db.delete(wildcard)
     await db.commit()
+    wildcard_cache.clear()
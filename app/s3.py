@@ -1,19 +1,45 @@
 import logging
 import mimetypes
+import re
+import threading
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 _client = None
+_client_lock = threading.Lock()
+
+# Every helper here is synchronous and reached through asyncio.to_thread, so the event loop's
+# default executor, not botocore, is what caps concurrent S3 work. Its stock size is
+# min(32, cpu + 4) — six threads on a 2-vCPU box — which queues every presign and thumbnail
+# behind a couple of slow uploads. main.lifespan installs an executor of this size instead.
+IO_THREADS = 64
 
 
 def _get_client():
+    # Callers are worker threads, so two first calls can race. boto3 clients are thread-safe
+    # once built; only construction needs the lock.
     global _client
     if _client is None:
-        _client = boto3.client("s3", region_name=settings.aws_region)
+        with _client_lock:
+            if _client is None:
+                _client = boto3.client(
+                    "s3",
+                    region_name=settings.aws_region,
+                    use_ssl=True,
+                    config=Config(
+                        # botocore defaults to 10 pooled connections; with IO_THREADS workers
+                        # the rest would block waiting for a socket.
+                        max_pool_connections=IO_THREADS,
+                        retries={"max_attempts": 3, "mode": "standard"},
+                        tcp_keepalive=True,
+                    ),
+                )
     return _client
 
 
@@ -59,8 +85,7 @@ def upload_file(path: str, key: str, bucket: str) -> str:
 
 def download_bytes(uri: str) -> bytes:
     """Download bytes from an S3 URI (s3://bucket/key)."""
-    parts = uri.replace("s3://", "").split("/", 1)
-    bucket, key = parts[0], parts[1]
+    bucket, key = parse_s3_uri(uri)
     client = _get_client()
     resp = client.get_object(Bucket=bucket, Key=key)
     return resp["Body"].read()
@@ -124,11 +149,25 @@ def delete_object(uri: str) -> None:
     logger.info("Deleted %s/%s", bucket, key)
 
 
+# Large objects are fetched as parallel ranged GETs on boto3's own transfer threads, each
+# holding a connection from the client's pool of IO_THREADS. That pool does not make callers
+# wait: past the limit botocore opens extra connections and throws them away afterwards, so
+# oversubscribing it costs a TLS handshake per request rather than queueing. A stitch runs
+# stitch.DOWNLOAD_CONCURRENCY downloads at once; 4 ranges each keeps it to half the pool and
+# leaves the rest warm for request-path calls (presigns, thumbnails, uploads).
+_DOWNLOAD_TRANSFER = TransferConfig(
+    multipart_threshold=16 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+
 def download_file(uri: str, local_path: str) -> None:
     """Download an S3 object to a local file (streams to disk)."""
     bucket, key = parse_s3_uri(uri)
     client = _get_client()
-    client.download_file(bucket, key, local_path)
+    client.download_file(bucket, key, local_path, Config=_DOWNLOAD_TRANSFER)
     logger.info("Downloaded %s to %s", uri, local_path)
 
 
@@ -223,9 +262,11 @@ def generate_presigned_url(uri: str, expires: int = 21600) -> str:
 
 def head_object(uri: str) -> dict | None:
     """Return {Key, Size, LastModified} for a single S3 object, or None."""
-    bucket, key = parse_s3_uri(uri)
     client = _get_client()
     try:
+        # Inside the try: a stored path that is not an s3:// URI is just an object that does
+        # not exist, not a 500.
+        bucket, key = parse_s3_uri(uri)
         resp = client.head_object(Bucket=bucket, Key=key)
         return {
             "Key": key,
@@ -236,7 +277,15 @@ def head_object(uri: str) -> dict | None:
         return None
 
 
+# Anchored on the scheme only, so a key that itself contains "s3://" survives intact. Not
+# urlsplit: keys are user filenames, and a "#" or "?" in one would be cut off as a fragment
+# or query string.
+_S3_URI_RE = re.compile(r"s3://([^/]+)/(.+)", re.IGNORECASE | re.DOTALL)
+
+
 def parse_s3_uri(uri: str) -> tuple[str, str]:
-    """Parse s3://bucket/key into (bucket, key)."""
-    parts = uri.replace("s3://", "").split("/", 1)
-    return parts[0], parts[1]
+    """Parse s3://bucket/key into (bucket, key). Raises ValueError if uri is not one."""
+    m = _S3_URI_RE.fullmatch(uri)
+    if m is None:
+        raise ValueError(f"Not an S3 URI: {uri!r}")
+    return m.group(1), m.group(2)
@@ -1,10 +1,27 @@
-from app.schemas.auth import LoginRequest, TokenResponse
-from app.schemas.jobs import JobCreate, JobDetailResponse, JobResponse, JobUpdate
-from app.schemas.loras import LoraCreate, LoraListItem, LoraResponse, LoraUpdate
-from app.schemas.segments import SegmentClaimResponse, SegmentCreate, SegmentResponse, SegmentStatusUpdate
-from app.schemas.videos import VideoResponse
+import importlib
 
-__all__ = [
+# Loaded on first attribute access. Every route imports its schema submodule directly, and
+# importing any submodule runs this file first - eager imports here would pull in every schema
+# module whichever one was actually asked for.
+_LAZY = {
+    "LoginRequest": "app.schemas.auth",
+    "TokenResponse": "app.schemas.auth",
+    "JobCreate": "app.schemas.jobs",
+    "JobDetailResponse": "app.schemas.jobs",
+    "JobResponse": "app.schemas.jobs",
+    "JobUpdate": "app.schemas.jobs",
+    "LoraCreate": "app.schemas.loras",
+    "LoraListItem": "app.schemas.loras",
+    "LoraResponse": "app.schemas.loras",
+    "LoraUpdate": "app.schemas.loras",
+    "SegmentCreate": "app.schemas.segments",
+    "SegmentResponse": "app.schemas.segments",
+    "SegmentClaimResponse": "app.schemas.segments",
+    "SegmentStatusUpdate": "app.schemas.segments",
+    "VideoResponse": "app.schemas.videos",
+}
+
+__all__ = (
     "LoginRequest",
     "TokenResponse",
     "JobCreate",
@@ -20,4 +37,18 @@ __all__ = [
     "SegmentClaimResponse",
     "SegmentStatusUpdate",
     "VideoResponse",
-]
+)
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
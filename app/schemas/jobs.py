@@ -4,13 +4,21 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.orm import TrustedORMModel
 from app.schemas.segments import SegmentCreate, SegmentResponse
 from app.schemas.videos import VideoResponse
 
+# Core validators are built on first use instead of at import; app.main builds the ones
+# the mounted routes need during startup.
+_CFG = {"from_attributes": True, "defer_build": True}
+_DEFER = {"defer_build": True}
+
 
 class JobReorderRequest(BaseModel):
     job_ids: list[UUID]
 
+    model_config = _DEFER
+
 
 class JobCreate(BaseModel):
     name: str
@@ -51,6 +59,8 @@ class JobCreate(BaseModel):
     first_segment: SegmentCreate
     tags: Optional[str] = Field(None, max_length=500)
 
+    model_config = _DEFER
+
 
 class JobLoraSummary(BaseModel):
     lora_id: Optional[str] = None
@@ -60,8 +70,10 @@ class JobLoraSummary(BaseModel):
     high_weight: Optional[float] = None
     low_weight: Optional[float] = None
 
+    model_config = _DEFER
 
-class JobResponse(BaseModel):
+
+class JobResponse(TrustedORMModel):
     id: UUID
     name: str
     width: int
@@ -110,7 +122,7 @@ class JobResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = _CFG
 
 
 class JobListResponse(BaseModel):
@@ -119,6 +131,8 @@ class JobListResponse(BaseModel):
     limit: int
     offset: int
 
+    model_config = _DEFER
+
 
 class IdentityAggregate(BaseModel):
     """Job-level identity, derived from the per-segment scores rather than re-measuring.
@@ -147,6 +161,8 @@ class IdentityAggregate(BaseModel):
     start_cos_ref: Optional[float] = None
     end_cos_ref: Optional[float] = None
 
+    model_config = _DEFER
+
 
 class JobDetailResponse(JobResponse):
     segments: list[SegmentResponse]
@@ -165,6 +181,8 @@ class JobUpdate(BaseModel):
     config_starred: Optional[bool] = Field(None, description="Flag this job's config as a successful one")
     video_preset_id: Optional[UUID] = Field(None, description="Job default video-settings preset")
 
+    model_config = _DEFER
+
 
 class WorkerStatsItem(BaseModel):
     worker_name: str
@@ -172,6 +190,8 @@ class WorkerStatsItem(BaseModel):
     avg_run_time: float
     last_seen: Optional[datetime] = None
 
+    model_config = _DEFER
+
 
 class StatsResponse(BaseModel):
     jobs_by_status: dict[str, int]
@@ -183,3 +203,5 @@ class StatsResponse(BaseModel):
     # priced with the same estimator the job queue uses.
     total_queue_time: float
     worker_stats: list[WorkerStatsItem]
+
+    model_config = _DEFER
@@ -4,6 +4,13 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.schemas.orm import TrustedORMModel
+
+# Core validators are built on first use instead of at import; app.main builds the ones
+# the mounted routes need during startup.
+_CFG = {"from_attributes": True, "defer_build": True}
+_DEFER = {"defer_build": True}
+
 
 class LoraCreate(BaseModel):
     name: str
@@ -16,6 +23,8 @@ class LoraCreate(BaseModel):
     default_high_weight: float = 1.0
     default_low_weight: float = 1.0
 
+    model_config = _DEFER
+
 
 class LoraUpdate(BaseModel):
     name: Optional[str] = None
@@ -31,8 +40,10 @@ class LoraUpdate(BaseModel):
     default_high_weight: Optional[float] = None
     default_low_weight: Optional[float] = None
 
+    model_config = _DEFER
+
 
-class LoraResponse(BaseModel):
+class LoraResponse(TrustedORMModel):
     id: UUID
     name: str
     description: Optional[str]
@@ -49,10 +60,10 @@ class LoraResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = _CFG
 
 
-class LoraListItem(BaseModel):
+class LoraListItem(TrustedORMModel):
     id: UUID
     name: str
     trigger_words: Optional[str]
@@ -63,4 +74,4 @@ class LoraListItem(BaseModel):
     default_low_weight: float
     default_prompt: Optional[str]
 
-    model_config = {"from_attributes": True}
+    model_config = _CFG
@@ -0,0 +1,70 @@
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, ClassVar
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import inspect as sa_inspect
+
+
+class TrustedORMModel(BaseModel):
+    """Response schema that can be built from an ORM row without re-validating it.
+
+    model_validate(row) walks the full validator tree for every field of every row, which is
+    most of the cost of a job detail with a few hundred segments. Rows we just loaded from our
+    own database already have the right types, so from_orm_trusted() copies the attributes
+    straight into model_construct() instead. Fields the row has no attribute for (computed
+    ones like estimated_run_time) are left out so their schema defaults apply.
+
+    Only column attributes are read from a mapped row. A relationship field is never touched:
+    reading an unloaded one lazy-loads, which raises MissingGreenlet under AsyncSession, and a
+    loaded one would hand raw ORM objects to a field typed as a response model. Callers pass
+    such fields explicitly, already converted, as keyword arguments.
+
+    Only for data read back from the database - request bodies still go through validation.
+    """
+
+    __orm_fields__: ClassVar[tuple[str, ...]] = ()
+    # Per source class: the field names read from it, and one attrgetter fetching them all.
+    __orm_getters__: ClassVar[dict[type, tuple[tuple[str, ...], Callable[[Any], Any]]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__orm_fields__ = tuple(cls.__pydantic_fields__)
+        cls.__orm_getters__ = {}
+
+    @classmethod
+    def _orm_field_names(cls, source: type) -> tuple[str, ...]:
+        mapper = sa_inspect(source, raiseerr=False)
+        if mapper is None:
+            # Not a mapped class: any attribute it defines is a plain one.
+            return tuple(name for name in cls.__orm_fields__ if hasattr(source, name))
+        columns = set(mapper.column_attrs.keys())
+        return tuple(name for name in cls.__orm_fields__ if name in columns)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any, **values: Any):
+        """Build from obj's column attributes; `values` adds or overrides fields explicitly."""
+        source = type(obj)
+        try:
+            names, getter = cls.__orm_getters__[source]
+        except KeyError:
+            names = cls._orm_field_names(source)
+            getter = attrgetter(*names) if names else (lambda _obj: ())
+            cls.__orm_getters__[source] = (names, getter)
+        row_values = getter(obj)
+        if len(names) == 1:  # attrgetter of one name returns the bare value
+            row_values = (row_values,)
+        return cls.model_construct(**{**dict(zip(names, row_values)), **values})
+
+
+@lru_cache(maxsize=64)
+def list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Shared TypeAdapter for list[model], built on first use.
+
+    Validating a whole result set through one adapter is a single call into pydantic-core
+    instead of one model_validate() per row, and building an adapter is far more expensive
+    than using one, so each list type gets exactly one. Lazy rather than module-level so it
+    does not undo defer_build on the schema modules.
+    """
+    return TypeAdapter(list[model])
@@ -4,12 +4,23 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, model_validator
 
+from app.schemas.orm import TrustedORMModel
+
+# Core validators are built on first use instead of at import; app.main builds the ones
+# the mounted routes need during startup.
+_CFG = {"from_attributes": True, "defer_build": True}
+_DEFER = {"defer_build": True}
+
 
 class SegmentCreate(BaseModel):
     prompt: str
     duration_seconds: float = 5.0
     speed: float = Field(default=1.0, ge=0.25, le=4.0)
     start_image: Optional[str] = None
+    # Deliberately untyped. Entries come in three untagged shapes - {"lora_id", weights}
+    # references, resolved file dicts, and legacy raw filename strings - that are stored and
+    # sent to the daemon as-is, so there is no discriminator to switch on without changing
+    # the wire format. Any is also the cheapest element validator pydantic has.
     loras: Optional[list[Any]] = None
     faceswap_enabled: bool = False
     faceswap_method: Optional[str] = None
@@ -27,8 +38,10 @@ class SegmentCreate(BaseModel):
     transition: Optional[str] = None
     video_preset_id: Optional[UUID] = None
 
+    model_config = _DEFER
+
 
-class SegmentResponse(BaseModel):
+class SegmentResponse(TrustedORMModel):
     id: UUID
     job_id: UUID
     index: int
@@ -87,7 +100,7 @@ class SegmentResponse(BaseModel):
     progress_log: Optional[str]
     estimated_run_time: Optional[float] = None
 
-    model_config = {"from_attributes": True}
+    model_config = _CFG
 
 
 class WorkerSegmentResponse(BaseModel):
@@ -102,6 +115,8 @@ class WorkerSegmentResponse(BaseModel):
     claimed_at: Optional[datetime]
     completed_at: Optional[datetime]
 
+    model_config = _DEFER
+
 
 class SegmentClaimResponse(BaseModel):
     id: UUID
@@ -185,7 +200,7 @@ class SegmentClaimResponse(BaseModel):
     lynx_scheduler: Optional[str] = None
     lynx_distill_strength: Optional[float] = None
 
-    model_config = {"from_attributes": True}
+    model_config = _CFG
 
 
 class SmashcutRequest(BaseModel):
@@ -197,6 +212,8 @@ class SmashcutRequest(BaseModel):
     # retiming. <1 is slow-motion, >1 is fast-forward.
     clip_speeds: Optional[list[float]] = None
 
+    model_config = _DEFER
+
 
 class SegmentClipResponse(BaseModel):
     """A segment surfaced as a pickable clip in the Foundry pool / smashcut builder."""
@@ -213,28 +230,36 @@ class SegmentClipResponse(BaseModel):
     motion_magnitude: Optional[float] = None
     favorite: bool = False
 
-    model_config = {"from_attributes": True}
+    model_config = _CFG
 
 
 class SegmentTrimUpdate(BaseModel):
     trim_start_frames: int = Field(ge=0)
     trim_end_frames: int = Field(ge=0)
 
+    model_config = _DEFER
+
 
 class SegmentVideoPresetUpdate(BaseModel):
     video_preset_id: Optional[UUID] = None
 
+    model_config = _DEFER
+
 
 class FramePreview(BaseModel):
     frame_index: int
     data_url: str
 
+    model_config = _DEFER
+
 
 class FramePreviewResponse(BaseModel):
     total_frames: int
     fps: float
     frames: list[FramePreview]
 
+    model_config = _DEFER
+
 
 class SegmentReprocessRequest(BaseModel):
     faceswap_enabled: bool = True
@@ -246,6 +271,8 @@ class SegmentReprocessRequest(BaseModel):
     faceswap_model: Optional[str] = None
     faceswap_pixel_boost: Optional[str] = None
 
+    model_config = _DEFER
+
 
 class HologramRequest(BaseModel):
     """Per-request overrides for a 'Make Hologram' action. Unset -> AppSetting -> hardcoded default."""
@@ -255,6 +282,8 @@ class HologramRequest(BaseModel):
     flavor: Optional[str] = None  # "2d_matte" (default) or "2.5d_depth"
     depth_scale_m: Optional[float] = None  # 2.5d relief depth in meters (clamped 0.03..0.60)
 
+    model_config = _DEFER
+
 
 class SegmentStatusUpdate(BaseModel):
     status: Optional[str] = None
@@ -278,3 +307,5 @@ class SegmentStatusUpdate(BaseModel):
     vace_overlap_seconds: Optional[float] = None
     # Lynx identity QA measured by the daemon. Measurement only — no gating.
     lynx_identity_scores: Optional[dict[str, Any]] = None
+
+    model_config = _DEFER
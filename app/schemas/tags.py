@@ -3,11 +3,18 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+# Core validators are built on first use instead of at import; app.main builds the ones
+# the mounted routes need during startup.
+_CFG = {"from_attributes": True, "defer_build": True}
+_DEFER = {"defer_build": True}
+
 
 class TitleTagCreate(BaseModel):
     name: str
     group: int
 
+    model_config = _DEFER
+
 
 class TitleTagResponse(BaseModel):
     id: UUID
@@ -16,4 +23,4 @@ class TitleTagResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = _CFG
@@ -2,10 +2,14 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from app.schemas.orm import TrustedORMModel
 
+# Core validators are built on first use instead of at import; app.main builds the ones
+# the mounted routes need during startup.
+_CFG = {"from_attributes": True, "defer_build": True}
 
-class VideoResponse(BaseModel):
+
+class VideoResponse(TrustedORMModel):
     id: UUID
     job_id: UUID
     output_path: Optional[str]
@@ -16,4 +20,4 @@ class VideoResponse(BaseModel):
     created_at: datetime
     completed_at: Optional[datetime]
 
-    model_config = {"from_attributes": True}
+    model_config = _CFG
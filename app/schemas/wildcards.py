@@ -4,16 +4,25 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+# Core validators are built on first use instead of at import; app.main builds the ones
+# the mounted routes need during startup.
+_CFG = {"from_attributes": True, "defer_build": True}
+_DEFER = {"defer_build": True}
+
 
 class WildcardCreate(BaseModel):
     name: str
     options: list[str] = []
 
+    model_config = _DEFER
+
 
 class WildcardUpdate(BaseModel):
     name: Optional[str] = None
     options: Optional[list[str]] = None
 
+    model_config = _DEFER
+
 
 class WildcardResponse(BaseModel):
     id: UUID
@@ -22,4 +31,16 @@ class WildcardResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = _CFG
+
+
+class WildcardNameResponse(BaseModel):
+    """Slim projection for pickers/autocomplete: no options array.
+
+    Built from (id, name) row mappings only. Deliberately not from_attributes: a full ORM row
+    must never validate as this shape inside the list route's union response_model.
+    """
+    id: UUID
+    name: str
+
+    model_config = _DEFER
@@ -6,7 +6,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.orm import selectinload
 
 from app.config import settings
 from app.database import async_session
@@ -16,8 +17,14 @@ from app.s3 import download_file, upload_file
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
 FADE_DURATION = 1.0
 FLASH_DURATION = 1.0
+# Segment downloads in flight at once. Each takes one default-executor thread (of
+# s3.IO_THREADS) plus the ranged-GET connections s3._DOWNLOAD_TRANSFER allows it; together a
+# stitch uses at most half the S3 connection pool, leaving the rest to request handlers.
+DOWNLOAD_CONCURRENCY = 8
 
 
 def _apply_fades(input_path: str, output_path: str, duration: float,
@@ -140,6 +147,32 @@ def _crossfade_concat(input_paths: list[str], durations: list[float],
     return running
 
 
+def _concat_copy(tmppath: Path, names: list[str], output_path: Path) -> Path:
+    """Join clips in tmppath end to end without re-encoding. Returns the path of the result.
+
+    The output is a regular MP4 with the moov box moved to the front (+faststart), so browsers
+    get the duration and can seek before the whole file has downloaded.
+    """
+    concat_list = tmppath / "concat.txt"
+    concat_list.write_text("\n".join(f"file '{name}'" for name in names))
+    proc = subprocess.run(
+        [
+            "ffmpeg", "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_list),
+            "-c", "copy",
+            "-movflags", "+faststart",
+            str(output_path),
+        ],
+        capture_output=True,
+        timeout=300,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed: {proc.stderr.decode()[-500:]}")
+    return output_path
+
+
 def _compute_fades(segments: list) -> list[tuple[bool, bool]]:
     """Return (fade_in, fade_out) for each segment based on transition settings.
 
@@ -159,58 +192,94 @@ def _compute_fades(segments: list) -> list[tuple[bool, bool]]:
     return result
 
 
+async def _download_segments(segments: list, tmppath: Path) -> list[str]:
+    """Download every segment's output into tmppath concurrently.
+
+    Returns the local file names in segment order, whatever order the downloads finish in.
+    On the first failure no queued download starts, and the error is raised only once the
+    ones already running have returned: a download thread cannot be cancelled, and one still
+    writing when the caller removes tmppath would write into a deleted directory.
+    """
+    sem = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+    failed = asyncio.Event()
+    local_files = [f"seg_{seg.index:03d}.mp4" for seg in segments]
+
+    async def fetch(seg, local_name: str) -> None:
+        async with sem:
+            if failed.is_set():
+                return
+            try:
+                await asyncio.to_thread(download_file, seg.output_path, str(tmppath / local_name))
+            except Exception:
+                failed.set()
+                raise
+
+    results = await asyncio.gather(
+        *(fetch(seg, name) for seg, name in zip(segments, local_files)),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return local_files
+
+
 async def stitch_video(video_id: UUID, job_id: UUID) -> None:
     """Background task: download segment videos, concat with ffmpeg, upload result."""
     async with async_session() as db:
         try:
-            # Set job to finalizing
-            job = await db.get(Job, job_id)
-            video = await db.get(Video, video_id)
-            if not job or not video:
+            # Job, video and the job's completed segments (ordered by index via the
+            # relationship) in one round trip for the pair plus one for the segments.
+            result = await db.execute(
+                select(Job, Video)
+                .join(Video, Video.job_id == Job.id)
+                .where(Job.id == job_id, Video.id == video_id)
+                .options(selectinload(Job.segments.and_(Segment.status == SegmentStatus.COMPLETED)))
+            )
+            row = result.one_or_none()
+            if row is None:
                 logger.error("stitch_video: job %s or video %s not found", job_id, video_id)
                 return
+            job, video = row
+            segments = job.segments
+
+            # Set job to finalizing
             job.status = JobStatus.FINALIZING
             await db.commit()
 
-            # Fetch completed segments ordered by index
-            result = await db.execute(
-                select(Segment)
-                .where(Segment.job_id == job_id, Segment.status == SegmentStatus.COMPLETED)
-                .order_by(Segment.index)
-            )
-            segments = result.scalars().all()
-
             if not segments:
                 raise ValueError("No completed segments to stitch")
 
-            missing = [s.index for s in segments if not s.output_path]
+            # One pass over the segments for everything the stitch needs to know up front.
+            missing = []
+            durations = []
+            extra_end_trim = [0] * len(segments)
+            transitions_used = False
+            for i, seg in enumerate(segments):
+                if not seg.output_path:
+                    missing.append(seg.index)
+                duration = seg.duration_seconds
+                # VACE overlap: a continuation segment carries a reconstructed lead-in
+                # (vace_overlap_seconds) that re-creates the previous segment's tail. Trim
+                # that tail off the *previous* segment so the reconstruction replaces it —
+                # consecutive frames across the seam, rather than jumping to the first
+                # generated frame (which drifts slightly and reads as a hitch).
+                overlap = seg.vace_overlap_seconds
+                if overlap and i > 0:
+                    extra_end_trim[i - 1] += round(overlap * job.fps)
+                    duration += overlap  # actual output = intended + reconstructed lead-in
+                durations.append(duration)
+                if seg.transition in ("fade", "flash"):
+                    transitions_used = True
             if missing:
                 raise ValueError(f"Segments missing output_path: {missing}")
 
             with tempfile.TemporaryDirectory() as tmpdir:
                 tmppath = Path(tmpdir)
 
-                # Download each segment video
-                local_files = []
-                for seg in segments:
-                    local_name = f"seg_{seg.index:03d}.mp4"
-                    local_path = tmppath / local_name
-                    await asyncio.to_thread(download_file, seg.output_path, str(local_path))
-                    local_files.append(local_name)
+                local_files = await _download_segments(segments, tmppath)
 
                 # Trim pass: apply trim to segments with non-zero trim values.
-                durations = [seg.duration_seconds for seg in segments]
-                # VACE overlap: a continuation segment carries a reconstructed lead-in
-                # (vace_overlap_seconds) that re-creates the previous segment's tail. Trim
-                # that tail off the *previous* segment so the reconstruction replaces it —
-                # consecutive frames across the seam, rather than jumping to the first
-                # generated frame (which drifts slightly and reads as a hitch).
-                extra_end_trim = [0] * len(segments)
-                for i, seg in enumerate(segments):
-                    overlap = seg.vace_overlap_seconds
-                    if overlap and i > 0:
-                        extra_end_trim[i - 1] += round(overlap * job.fps)
-                        durations[i] += overlap  # actual output = intended + reconstructed lead-in
                 for i, seg in enumerate(segments):
                     end_trim = seg.trim_end_frames + extra_end_trim[i]
                     if seg.trim_start_frames > 0 or end_trim > 0:
@@ -231,10 +300,10 @@ async def stitch_video(video_id: UUID, job_id: UUID) -> None:
                 # coexist with fade-to-black / flash transitions, so those still take the
                 # concat path. VACE will later supersede this with real continuation.
                 crossfade = settings.stitch_crossfade_seconds or 0.0
-                transitions_used = any(seg.transition in ("fade", "flash") for seg in segments)
                 use_crossfade = crossfade > 0 and len(segments) >= 2 and not transitions_used
 
                 output_path = tmppath / "final.mp4"
+                s3_key = f"{job_id}/final.mp4"
                 total_duration = sum(durations)
 
                 if use_crossfade:
@@ -288,31 +357,16 @@ async def stitch_video(video_id: UUID, job_id: UUID) -> None:
                             )
                             concat_names.append(black_name)
 
-                    # Write ffmpeg concat list
-                    concat_list = tmppath / "concat.txt"
-                    concat_list.write_text(
-                        "\n".join(f"file '{name}'" for name in concat_names)
-                    )
-
-                    # Run ffmpeg concat (no re-encoding)
-                    proc = await asyncio.to_thread(
-                        subprocess.run,
-                        [
-                            "ffmpeg", "-y",
-                            "-f", "concat",
-                            "-safe", "0",
-                            "-i", str(concat_list),
-                            "-c", "copy",
-                            str(output_path),
-                        ],
-                        capture_output=True,
-                        timeout=300,
-                    )
-                    if proc.returncode != 0:
-                        raise RuntimeError(f"ffmpeg failed: {proc.stderr.decode()[-500:]}")
+                    if len(concat_names) == 1:
+                        # A single clip is already the finished video; remuxing it through
+                        # ffmpeg would only produce an identical copy.
+                        output_path = tmppath / concat_names[0]
+                    else:
+                        output_path = await asyncio.to_thread(
+                            _concat_copy, tmppath, concat_names, output_path
+                        )
 
                 # Upload to S3
-                s3_key = f"{job_id}/final.mp4"
                 s3_uri = await asyncio.to_thread(
                     upload_file, str(output_path), s3_key, settings.s3_jobs_bucket
                 )
@@ -321,7 +375,7 @@ async def stitch_video(video_id: UUID, job_id: UUID) -> None:
             video.output_path = s3_uri
             video.duration_seconds = total_duration
             video.status = VideoStatus.COMPLETED
-            video.completed_at = datetime.now(timezone.utc)
+            video.completed_at = datetime.now(_UTC)
             job.status = JobStatus.FINALIZED
             await db.commit()
             logger.info("Stitch complete for job %s -> %s", job_id, s3_uri)
@@ -329,14 +383,17 @@ async def stitch_video(video_id: UUID, job_id: UUID) -> None:
         except Exception as e:
             logger.exception("Stitch failed for job %s: %s", job_id, e)
             try:
+                # Plain UPDATEs by id: nothing here needs the rows loaded, and after a rollback
+                # the instances from the initial load are expired anyway.
                 await db.rollback()
-                video = await db.get(Video, video_id)
-                job = await db.get(Job, job_id)
-                if video:
-                    video.status = VideoStatus.FAILED
-                    video.error_message = str(e)[:2000]
-                if job:
-                    job.status = JobStatus.FINALIZED
+                await db.execute(
+                    update(Video)
+                    .where(Video.id == video_id)
+                    .values(status=VideoStatus.FAILED, error_message=str(e)[:2000])
+                )
+                await db.execute(
+                    update(Job).where(Job.id == job_id).values(status=JobStatus.FINALIZED)
+                )
                 await db.commit()
             except Exception:
                 logger.exception("Failed to record stitch error for job %s", job_id)
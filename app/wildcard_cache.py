@@ -0,0 +1,37 @@
+"""In-process cache of wildcard options, shared by prompt resolution and the wildcard routes.
+
+Wildcards are read on every prompt and edited rarely, so their options are kept for a short
+while. The wildcard routes call clear() on every write, so edits made through this process show
+up at once; other replicas pick them up within the TTL.
+"""
+
+import time
+
+WILDCARD_CACHE_TTL_SECONDS = 60
+
+# name -> (monotonic time stored, options). Options are a tuple: every request that hits the
+# cache shares the object, so it must not be mutable.
+_cache: dict[str, tuple[float, tuple[str, ...]]] = {}
+
+
+def get_options(name: str, now: float | None = None) -> tuple[str, ...] | None:
+    """The cached options for `name`, or None if absent or older than the TTL."""
+    entry = _cache.get(name)
+    if entry is None:
+        return None
+    stored_at, options = entry
+    if (time.monotonic() if now is None else now) - stored_at >= WILDCARD_CACHE_TTL_SECONDS:
+        return None
+    return options
+
+
+def store_options(name: str, options, now: float | None = None) -> tuple[str, ...]:
+    """Cache a copy of `options` for `name` and return it."""
+    cached = tuple(options)
+    _cache[name] = (time.monotonic() if now is None else now, cached)
+    return cached
+
+
+def clear() -> None:
+    """Drop every entry; called after any wildcard is created, edited or deleted."""
+    _cache.clear()
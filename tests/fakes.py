@@ -0,0 +1,24 @@
+"""Hand-rolled test doubles shared across the unit tests."""
+
+
+class _FakeResult:
+    def __init__(self, rows: list):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self) -> list:
+        return self._rows
+
+
+class FakeAsyncSession:
+    """Just enough AsyncSession for the resolvers: records each statement, returns fixed rows."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _FakeResult(self.rows)
@@ -10,7 +10,7 @@ import jwt as pyjwt
 import pytest
 from fastapi import HTTPException
 
-from app.auth import create_access_token, decode_access_token, hash_password, verify_password
+from app.auth import create_access_token, decode_access_token, hash_password, verify_password, verify_password_async
 from app.config import settings
 
 
@@ -35,6 +35,13 @@ class TestPasswordHashing:
         assert verify_password(password, h1)
         assert verify_password(password, h2)
 
+    @pytest.mark.asyncio
+    async def test_async_verify_matches_sync(self):
+        """The off-loop variant gives the same answers as verify_password."""
+        hashed = hash_password("real-password")
+        assert await verify_password_async("real-password", hashed) is True
+        assert await verify_password_async("wrong-password", hashed) is False
+
 
 class TestJWTTokens:
     def test_create_and_decode_roundtrip(self):
@@ -76,6 +83,27 @@ class TestJWTTokens:
             decode_access_token(token)
         assert exc_info.value.status_code == 401
 
+    @pytest.mark.parametrize("algorithm", ["HS512", "none"])
+    def test_other_algorithms_are_rejected(self, algorithm):
+        """Only HS256 is accepted, even with the right secret or no signature at all."""
+        payload = {
+            "sub": str(uuid.uuid4()),
+            "exp": datetime.now(timezone.utc) + timedelta(hours=1),
+        }
+        key = None if algorithm == "none" else settings.jwt_secret
+        token = pyjwt.encode(payload, key, algorithm=algorithm)
+
+        with pytest.raises(HTTPException) as exc_info:
+            decode_access_token(token)
+        assert exc_info.value.status_code == 401
+
+    def test_tokens_verify_with_the_raw_secret(self):
+        """Tokens we issue are ordinary HS256 JWTs over the configured secret."""
+        user_id = uuid.uuid4()
+        token = create_access_token(user_id)
+        payload = pyjwt.decode(token, settings.jwt_secret, algorithms=["HS256"])
+        assert payload["sub"] == str(user_id)
+
     def test_garbage_string_raises_401(self):
         """A completely invalid string is rejected with 401."""
         with pytest.raises(HTTPException) as exc_info:
@@ -28,3 +28,15 @@ class TestHealthEndpoint:
         async with AsyncClient(transport=transport, base_url="http://test") as client:
             resp = await client.get("/health")
         assert resp.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_body_is_rendered_compact(self):
+        """Responses go through the app-wide JSON renderer: compact bytes, JSON content type."""
+        from httpx import ASGITransport, AsyncClient
+        from app.main import app
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get("/health")
+        assert resp.content == b'{"status":"ok"}'
+        assert resp.headers["content-type"] == "application/json"
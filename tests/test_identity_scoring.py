@@ -50,13 +50,14 @@ class TestFieldsExistEndToEnd:
         assert field in SegmentResponse.model_fields
 
     def test_patch_handler_persists_every_field(self):
-        """SegmentStatusUpdate is applied field-by-field, so a field can exist on the schema
-        AND the model and still never be written."""
-        src = SEGMENTS_ROUTE.read_text()
-        for field in IDENTITY_FIELDS:
-            assert f"segment.{field} = body.{field}" in src, (
-                f"PATCH /segments/{{id}} never assigns {field}; the daemon would send it "
-                f"and the API would silently discard it"
+        """PATCH /segments/{id} writes body.model_dump() straight into UPDATE ... SET, keyed by
+        field name, so a field can only be persisted if the model has a column of that exact
+        name. A renamed column would otherwise be a field the daemon sends and nothing stores.
+        (Round-tripped against a real database in test_segment_job_status_db.)"""
+        columns = Segment.__table__.columns
+        for field in SegmentStatusUpdate.model_fields:
+            assert field in columns, (
+                f"PATCH /segments/{{id}} cannot persist {field}: no Segment column of that name"
             )
 
 
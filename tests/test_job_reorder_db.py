@@ -0,0 +1,64 @@
+"""PUT /jobs/reorder against a real database (#162).
+
+The handler sets every priority in one UPDATE ... RETURNING that also enforces ownership, so
+these check both that the response matches what was stored and that a bad id changes nothing.
+"""
+
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import Job, User
+from app.routes.jobs import reorder_jobs
+from app.schemas.jobs import JobReorderRequest
+
+
+async def _jobs(db, n: int) -> tuple[User, list[Job]]:
+    user = User(username=f"u-{uuid.uuid4().hex[:8]}", password_hash="x")
+    db.add(user)
+    await db.flush()
+    jobs = [Job(user_id=user.id, name=f"j{i}", width=480, height=720, fps=16, seed=1, priority=i)
+            for i in range(n)]
+    db.add_all(jobs)
+    await db.flush()
+    return user, jobs
+
+
+class TestReorderJobs:
+    async def test_response_matches_stored_rows(self, db):
+        user, jobs = await _jobs(db, 3)
+        before = {j.id: j.updated_at for j in jobs}
+        order = [jobs[2].id, jobs[0].id, jobs[1].id]
+
+        returned = await reorder_jobs(JobReorderRequest(job_ids=order), user, db)
+
+        assert [r.id for r in returned] == order
+        assert [r.priority for r in returned] == [0, 1, 2]
+        db.expunge_all()
+        for r in returned:
+            stored = await db.get(Job, r.id)
+            assert (stored.priority, stored.updated_at) == (r.priority, r.updated_at)
+            assert r.updated_at > before[r.id]
+
+    async def test_foreign_job_is_rejected(self, db):
+        user, jobs = await _jobs(db, 1)
+        _other, foreign = await _jobs(db, 1)
+
+        # The savepoint stands in for get_db: the handler raises before committing, and the
+        # session it ran in is discarded.
+        with pytest.raises(HTTPException) as exc_info:
+            async with db.begin_nested():
+                await reorder_jobs(JobReorderRequest(job_ids=[foreign[0].id, jobs[0].id]), user, db)
+        assert exc_info.value.status_code == 400
+
+        db.expunge_all()
+        assert (await db.get(Job, jobs[0].id)).priority == 0
+        assert (await db.get(Job, foreign[0].id)).priority == 0
+
+    async def test_duplicate_id_is_rejected(self, db):
+        user, jobs = await _jobs(db, 2)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await reorder_jobs(JobReorderRequest(job_ids=[jobs[1].id, jobs[1].id]), user, db)
+        assert exc_info.value.status_code == 400
@@ -8,15 +8,11 @@ state machine logic itself.
 import pytest
 
 from app.enums import JOB_VALID_TRANSITIONS, JobStatus
+from app.enums import is_job_transition_allowed as is_transition_allowed
 
 ALL_STATUSES = set(JobStatus)
 
 
-def is_transition_allowed(current: str, target: str) -> bool:
-    """Check if a user-initiated status transition is allowed."""
-    return target in JOB_VALID_TRANSITIONS.get(current, set())
-
-
 class TestValidTransitions:
     """Every explicitly defined transition should be accepted."""
 
@@ -105,3 +101,13 @@ class TestArchiveTransitions:
 
     def test_processing_cannot_archive(self):
         assert not is_transition_allowed("processing", "archived")
+
+
+class TestFlattenedRulesMatchTheMap:
+    """is_job_transition_allowed must agree with JOB_VALID_TRANSITIONS on every pair."""
+
+    @pytest.mark.parametrize("current", sorted(ALL_STATUSES) + ["bogus"])
+    def test_every_pair(self, current):
+        for target in sorted(ALL_STATUSES) + ["bogus"]:
+            expected = target in JOB_VALID_TRANSITIONS.get(current, set())
+            assert is_transition_allowed(current, target) is expected, (current, target)
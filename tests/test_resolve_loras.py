@@ -2,51 +2,52 @@
 
 Tests _resolve_loras() from app/routes/segments.py, which translates
 {"lora_id": "<uuid>"} entries into full model metadata for the worker daemon.
-The DB session is mocked so no database is required.
+The DB session is a small fake so no database is required.
 """
 
 import uuid
-from unittest.mock import AsyncMock, MagicMock
+from dataclasses import dataclass, field
 
 import pytest
 from fastapi import HTTPException
 
-from app.routes.segments import _resolve_loras
+from app.routes.segments import _build_lora_entries, _lora_refs, _resolve_loras
+from app.schemas.segments import SegmentCreate
+from tests.fakes import FakeAsyncSession
 
 
-def _make_lora(**overrides):
-    """Build a mock Lora ORM object with sensible defaults."""
-    lora = MagicMock()
-    lora.id = overrides.get("id", uuid.uuid4())
-    lora.high_file = overrides.get("high_file", "model_v2_high.safetensors")
-    lora.high_s3_uri = overrides.get("high_s3_uri", "s3://loras/model_v2_high.safetensors")
-    lora.low_file = overrides.get("low_file", "model_v2_low.safetensors")
-    lora.low_s3_uri = overrides.get("low_s3_uri", "s3://loras/model_v2_low.safetensors")
-    lora.default_high_weight = overrides.get("default_high_weight", 1.0)
-    lora.default_low_weight = overrides.get("default_low_weight", 0.8)
-    return lora
+@dataclass(slots=True)
+class FakeLora:
+    """Stand-in for the LoRA row _resolve_loras selects: just the columns it reads."""
+
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+    high_file: str = "model_v2_high.safetensors"
+    high_s3_uri: str = "s3://loras/model_v2_high.safetensors"
+    low_file: str = "model_v2_low.safetensors"
+    low_s3_uri: str = "s3://loras/model_v2_low.safetensors"
+    default_high_weight: float = 1.0
+    default_low_weight: float = 0.8
 
 
 class TestResolveLoras:
     @pytest.mark.asyncio
     async def test_none_input_passes_through(self):
         """None loras input returns None without touching the DB."""
-        db = AsyncMock()
+        db = FakeAsyncSession()
         assert await _resolve_loras(db, None) is None
-        db.get.assert_not_called()
+        assert db.statements == []
 
     @pytest.mark.asyncio
     async def test_empty_list_passes_through(self):
         """Empty list returns empty list."""
-        db = AsyncMock()
+        db = FakeAsyncSession()
         assert await _resolve_loras(db, []) == []
 
     @pytest.mark.asyncio
     async def test_lora_id_resolved_with_default_weights(self):
         """A lora_id reference is expanded to full metadata using the model's defaults."""
-        lora = _make_lora()
-        db = AsyncMock()
-        db.get.return_value = lora
+        lora = FakeLora()
+        db = FakeAsyncSession([lora])
 
         result = await _resolve_loras(db, [{"lora_id": str(lora.id)}])
 
@@ -61,9 +62,8 @@ class TestResolveLoras:
     @pytest.mark.asyncio
     async def test_custom_weights_override_defaults(self):
         """User-supplied weights take precedence over the LoRA's defaults."""
-        lora = _make_lora(default_high_weight=1.0, default_low_weight=0.8)
-        db = AsyncMock()
-        db.get.return_value = lora
+        lora = FakeLora(default_high_weight=1.0, default_low_weight=0.8)
+        db = FakeAsyncSession([lora])
 
         result = await _resolve_loras(
             db, [{"lora_id": str(lora.id), "high_weight": 0.5, "low_weight": 0.3}]
@@ -75,8 +75,7 @@ class TestResolveLoras:
     @pytest.mark.asyncio
     async def test_nonexistent_lora_raises_400(self):
         """Referencing an unknown LoRA ID returns a 400 error with the ID in the message."""
-        db = AsyncMock()
-        db.get.return_value = None
+        db = FakeAsyncSession()
         bad_id = str(uuid.uuid4())
 
         with pytest.raises(HTTPException) as exc_info:
@@ -85,21 +84,140 @@ class TestResolveLoras:
         assert exc_info.value.status_code == 400
         assert bad_id in exc_info.value.detail
 
+    @pytest.mark.asyncio
+    async def test_all_references_fetched_in_one_query(self):
+        """Every lora_id in the list is looked up by a single IN query, not one get each."""
+        a, b = FakeLora(high_file="a.safetensors"), FakeLora(high_file="b.safetensors")
+        db = FakeAsyncSession([b, a])
+
+        result = await _resolve_loras(
+            db, [{"lora_id": str(a.id)}, "legacy.safetensors", {"lora_id": str(b.id)}]
+        )
+
+        assert [r if isinstance(r, str) else r["high_file"] for r in result] == [
+            "a.safetensors", "legacy.safetensors", "b.safetensors",
+        ]
+        assert len(db.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_lora_id_is_looked_up_once(self):
+        """The same LoRA referenced twice is one id in the query; each entry keeps its weights."""
+        lora = FakeLora()
+        db = FakeAsyncSession([lora])
+
+        result = await _resolve_loras(
+            db, [{"lora_id": str(lora.id)}, {"lora_id": str(lora.id), "high_weight": 0.2}]
+        )
+
+        assert [r["high_weight"] for r in result] == [1.0, 0.2]
+        assert len(db.statements) == 1
+        (ids,) = db.statements[0].compile().params.values()
+        assert list(ids) == [lora.id]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bad_id", ["not-a-uuid", "1234", "g" * 32, "-" * 36, 42])
+    async def test_malformed_lora_id_raises_400_without_a_query(self, bad_id):
+        """A lora_id that cannot be a UUID is rejected by name before the DB is asked."""
+        db = FakeAsyncSession()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await _resolve_loras(db, [{"lora_id": bad_id}])
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == f"Invalid lora_id: {bad_id}"
+        assert db.statements == []
+
+    @pytest.mark.asyncio
+    async def test_unhyphenated_lora_id_is_accepted(self):
+        lora = FakeLora()
+        db = FakeAsyncSession([lora])
+
+        result = await _resolve_loras(db, [{"lora_id": lora.id.hex}])
+
+        assert result[0]["lora_id"] == str(lora.id)
+
     @pytest.mark.asyncio
     async def test_non_dict_items_pass_through(self):
         """Legacy raw-string LoRA entries are forwarded unchanged."""
-        db = AsyncMock()
-        result = await _resolve_loras(db, ["my_model.safetensors"])
+        db = FakeAsyncSession()
+        loras = ["my_model.safetensors"]
+        result = await _resolve_loras(db, loras)
 
-        assert result == ["my_model.safetensors"]
-        db.get.assert_not_called()
+        assert result is loras
+        assert db.statements == []
 
     @pytest.mark.asyncio
     async def test_dict_without_lora_id_passes_through(self):
         """A dict entry with no lora_id key is forwarded unchanged (manual config)."""
-        db = AsyncMock()
+        db = FakeAsyncSession()
         manual = {"file": "custom.safetensors", "weight": 0.9}
-        result = await _resolve_loras(db, [manual])
+        loras = [manual]
+        result = await _resolve_loras(db, loras)
+
+        assert result is loras
+        assert db.statements == []
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_resolve_returns_input_list(self):
+        """With no lora_id anywhere the input list itself is returned, not a copy."""
+        db = FakeAsyncSession()
+        loras = ["my_model.safetensors", {"file": "custom.safetensors", "weight": 0.9}]
+
+        assert await _resolve_loras(db, loras) is loras
+        assert db.statements == []
+
+    @pytest.mark.asyncio
+    async def test_differently_spelled_ids_share_one_row(self):
+        """Upper- and lower-case spellings of one id are one id in the query."""
+        lora = FakeLora()
+        db = FakeAsyncSession([lora])
+
+        result = await _resolve_loras(db, [{"lora_id": str(lora.id)}, {"lora_id": str(lora.id).upper()}])
+
+        assert [r["lora_id"] for r in result] == [str(lora.id)] * 2
+        (ids,) = db.statements[0].compile().params.values()
+        assert list(ids) == [lora.id]
+
+
+class TestLoraBuilders:
+    """The sync halves of _resolve_loras: no session, no await."""
+
+    def test_refs_cover_only_references(self):
+        a, b = uuid.uuid4(), uuid.uuid4()
+        loras = [{"lora_id": str(a)}, "raw.safetensors", {"file": "x"}, {"lora_id": str(b)}, {"lora_id": str(a)}]
+        assert _lora_refs(loras) == {str(a): a, str(b): b}
+
+    def test_build_expands_references_in_place(self):
+        lora = FakeLora()
+        manual = {"file": "custom.safetensors", "weight": 0.9}
+
+        result = _build_lora_entries(["raw.safetensors", {"lora_id": str(lora.id)}, manual], {str(lora.id): lora})
+
+        assert result[0] == "raw.safetensors"
+        assert result[1]["high_file"] == "model_v2_high.safetensors"
+        assert result[2] is manual
+
+    def test_build_passes_through_every_non_reference_shape(self):
+        entries = ["raw.safetensors", {"file": "x"}, {"lora_id": None}, {"lora_id": ""}, ["odd"], None]
+        assert _build_lora_entries(entries, {}) == entries
+
+    def test_build_rejects_a_reference_missing_from_the_map(self):
+        with pytest.raises(HTTPException) as exc_info:
+            _build_lora_entries([{"lora_id": str(uuid.uuid4())}], {})
+        assert exc_info.value.status_code == 400
+
+
+class TestLorasSchemaShapes:
+    """SegmentCreate must accept every stored LoRA shape and hand it on untouched."""
+
+    LORAS = [
+        {"lora_id": str(uuid.uuid4()), "high_weight": 0.5},
+        {"lora_id": str(uuid.uuid4()), "high_file": "h.safetensors", "high_s3_uri": "s3://loras/h",
+         "high_weight": 1.0, "low_file": None, "low_s3_uri": None, "low_weight": 0.8},
+        {"file": "custom.safetensors", "weight": 0.9},
+        "my_model.safetensors",
+    ]
+
+    def test_create_accepts_every_shape(self):
+        assert SegmentCreate(prompt="p", loras=self.LORAS).loras == self.LORAS
 
-        assert result == [manual]
-        db.get.assert_not_called()
@@ -2,51 +2,52 @@
 
 Tests _resolve_wildcards() from app/routes/segments.py, which substitutes
 <name> placeholders in prompts with random choices from the Wildcard table.
-The DB session is mocked so no database is required.
+The DB session is a small fake so no database is required.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import random
+import time
+from dataclasses import dataclass
 
 import pytest
 
-from app.routes.segments import _resolve_wildcards
+from app import wildcard_cache
+from app.routes.segments import _resolve_wildcards, _substitute_wildcards
+from tests.fakes import FakeAsyncSession
 
 
-def _make_wildcard(name: str, options: list[str]):
-    """Build a mock Wildcard ORM object."""
-    wc = MagicMock()
-    wc.name = name
-    wc.options = options
-    return wc
+@pytest.fixture(autouse=True)
+def _fresh_wildcard_cache():
+    """Each test sees the DB mock it built, not options cached by an earlier one."""
+    wildcard_cache.clear()
+    yield
+    wildcard_cache.clear()
 
 
-def _mock_db(wildcards: list):
-    """Build an AsyncSession mock whose execute() returns the given wildcards."""
-    db = AsyncMock()
-    scalars = MagicMock()
-    scalars.all.return_value = wildcards
-    result = MagicMock()
-    result.scalars.return_value = scalars
-    db.execute.return_value = result
-    return db
+@dataclass(slots=True)
+class FakeWildcard:
+    """Stand-in for a Wildcard row with just the attributes _resolve_wildcards reads."""
+
+    name: str
+    options: list[str]
 
 
 class TestResolveWildcards:
     @pytest.mark.asyncio
     async def test_no_placeholders_returns_prompt_unchanged(self):
         """A plain prompt with no <angle brackets> comes back as-is, template=None."""
-        db = AsyncMock()
+        db = FakeAsyncSession()
         resolved, template = await _resolve_wildcards(db, "a sunset over the ocean")
 
         assert resolved == "a sunset over the ocean"
         assert template is None
-        db.execute.assert_not_called()
+        assert db.statements == []
 
     @pytest.mark.asyncio
     async def test_single_wildcard_is_substituted(self):
         """A <style> placeholder is replaced with one of its options."""
         # Use a single option so the outcome is deterministic
-        db = _mock_db([_make_wildcard("style", ["cinematic"])])
+        db = FakeAsyncSession([FakeWildcard("style", ["cinematic"])])
 
         resolved, template = await _resolve_wildcards(db, "a <style> portrait")
 
@@ -56,7 +57,7 @@ class TestResolveWildcards:
     @pytest.mark.asyncio
     async def test_unknown_wildcard_stays_in_prompt(self):
         """A placeholder with no matching DB record is left unreplaced."""
-        db = _mock_db([])  # DB has no wildcards
+        db = FakeAsyncSession()  # DB has no wildcards
 
         resolved, template = await _resolve_wildcards(db, "a <nonexistent> landscape")
 
@@ -66,9 +67,9 @@ class TestResolveWildcards:
     @pytest.mark.asyncio
     async def test_multiple_different_wildcards(self):
         """Two distinct placeholders are each resolved from their own options."""
-        db = _mock_db([
-            _make_wildcard("style", ["anime"]),
-            _make_wildcard("color", ["blue"]),
+        db = FakeAsyncSession([
+            FakeWildcard("style", ["anime"]),
+            FakeWildcard("color", ["blue"]),
         ])
 
         resolved, template = await _resolve_wildcards(
@@ -81,10 +82,132 @@ class TestResolveWildcards:
     @pytest.mark.asyncio
     async def test_duplicate_placeholder_replaced_everywhere(self):
         """All occurrences of the same <name> get the same replacement."""
-        db = _mock_db([_make_wildcard("mood", ["joyful"])])
+        db = FakeAsyncSession([FakeWildcard("mood", ["joyful"])])
 
         resolved, _ = await _resolve_wildcards(
             db, "<mood> person in a <mood> setting"
         )
 
         assert resolved == "joyful person in a joyful setting"
+
+    @pytest.mark.asyncio
+    async def test_one_choice_per_name_with_many_options(self):
+        """Each name is drawn once, so repeats agree even when there is a real choice."""
+        options = [f"opt{i}" for i in range(20)]
+        db = FakeAsyncSession([FakeWildcard("mood", options)])
+
+        for _ in range(10):
+            wildcard_cache.clear()
+            resolved, _ = await _resolve_wildcards(db, "<mood>|<mood>|<mood>")
+            first, *rest = resolved.split("|")
+            assert first in options
+            assert rest == [first, first]
+
+    @pytest.mark.asyncio
+    async def test_free_text_names_are_placeholders(self):
+        """Wildcard names are not limited to word characters."""
+        db = FakeAsyncSession([FakeWildcard("hair color", ["red"]), FakeWildcard("v1.2-look", ["noir"])])
+
+        resolved, _ = await _resolve_wildcards(db, "<hair color> hair, <v1.2-look>")
+
+        assert resolved == "red hair, noir"
+
+    @pytest.mark.asyncio
+    async def test_stray_brackets_are_not_placeholders(self):
+        """An empty <> or an unclosed < is plain text and never reaches the DB."""
+        db = FakeAsyncSession()
+        resolved, template = await _resolve_wildcards(db, "a <> b < c")
+
+        assert (resolved, template) == ("a <> b < c", None)
+        assert db.statements == []
+
+    @pytest.mark.asyncio
+    async def test_distinct_names_fetched_in_one_query(self):
+        """However many placeholders, the DB is asked once, for each distinct name."""
+        db = FakeAsyncSession([FakeWildcard("a", ["1"]), FakeWildcard("b", ["2"])])
+
+        resolved, _ = await _resolve_wildcards(db, "<a> <b> <a> <c>")
+
+        assert resolved == "1 2 1 <c>"
+        assert len(db.statements) == 1
+        (names,) = db.statements[0].compile().params.values()
+        assert sorted(names) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_wildcard_without_options_stays_in_prompt(self):
+        """A wildcard that exists but has no options is left as typed."""
+        db = FakeAsyncSession([FakeWildcard("empty", [])])
+
+        resolved, _ = await _resolve_wildcards(db, "a <empty> b")
+
+        assert resolved == "a <empty> b"
+
+
+class TestSubstituteWildcards:
+    """The sync half of _resolve_wildcards: no session, no await."""
+
+    def test_known_names_are_replaced(self):
+        assert _substitute_wildcards("<a> and <b>", {"a": ["x"], "b": ["y"]}) == "x and y"
+
+    def test_unknown_and_empty_names_are_left_as_typed(self):
+        assert _substitute_wildcards("<a> <b>", {"b": []}) == "<a> <b>"
+
+    def test_one_draw_per_distinct_name(self, monkeypatch):
+        draws = []
+
+        def choice(options):
+            draws.append(options)
+            return options[-1]
+
+        monkeypatch.setattr(random, "choice", choice)
+
+        assert _substitute_wildcards("<a><b><a><b><a>", {"a": ["1", "2"], "b": ["3"]}) == "23232"
+        assert sorted(draws) == [["1", "2"], ["3"]]
+
+
+class TestWildcardCache:
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_is_served_from_cache(self):
+        db = FakeAsyncSession([FakeWildcard("style", ["cinematic"])])
+
+        await _resolve_wildcards(db, "a <style> portrait")
+        resolved, _ = await _resolve_wildcards(db, "another <style> shot")
+
+        assert resolved == "another cinematic shot"
+        assert len(db.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_only_uncached_names_are_queried(self):
+        wildcard_cache.store_options("style", ["anime"])
+        db = FakeAsyncSession([FakeWildcard("color", ["blue"])])
+
+        resolved, _ = await _resolve_wildcards(db, "<style> in <color>")
+
+        assert resolved == "anime in blue"
+        (names,) = db.statements[0].compile().params.values()
+        assert list(names) == ["color"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_refetched(self):
+        wildcard_cache.store_options(
+            "style", ["stale"], now=time.monotonic() - wildcard_cache.WILDCARD_CACHE_TTL_SECONDS - 1
+        )
+        db = FakeAsyncSession([FakeWildcard("style", ["fresh"])])
+
+        resolved, _ = await _resolve_wildcards(db, "<style>")
+
+        assert resolved == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_cached_options_are_an_immutable_copy(self):
+        options = ["cinematic"]
+        await _resolve_wildcards(FakeAsyncSession([FakeWildcard("style", options)]), "<style>")
+        options.append("mutated")
+
+        assert wildcard_cache.get_options("style") == ("cinematic",)
+
+    @pytest.mark.asyncio
+    async def test_unknown_names_are_not_cached(self):
+        await _resolve_wildcards(FakeAsyncSession(), "<nonexistent>")
+
+        assert wildcard_cache.get_options("nonexistent") is None
@@ -0,0 +1,50 @@
+"""Tests for S3 URI parsing and the transfer settings of the S3 helpers."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app import s3, stitch
+from app.s3 import parse_s3_uri
+
+
+class TestParseS3Uri:
+    def test_bucket_and_key(self):
+        assert parse_s3_uri("s3://wanly-jobs/abc/0_output.mp4") == ("wanly-jobs", "abc/0_output.mp4")
+
+    def test_key_containing_scheme_is_preserved(self):
+        assert parse_s3_uri("s3://bucket/mirror/s3://other/key") == ("bucket", "mirror/s3://other/key")
+
+    def test_key_with_url_special_characters_is_preserved(self):
+        assert parse_s3_uri("s3://bucket/2026-07-09/take #2?.png") == ("bucket", "2026-07-09/take #2?.png")
+
+    def test_scheme_is_case_insensitive(self):
+        assert parse_s3_uri("S3://bucket/key") == ("bucket", "key")
+
+    @pytest.mark.parametrize("uri", ["s3://bucket", "s3://bucket/", "bucket/key", "https://bucket/key"])
+    def test_malformed_uri_raises(self, uri):
+        with pytest.raises(ValueError):
+            parse_s3_uri(uri)
+
+
+class TestDownloadFile:
+    def test_stitch_leaves_half_the_connection_pool_free(self, monkeypatch):
+        client = MagicMock()
+        monkeypatch.setattr(s3, "_get_client", lambda: client)
+        s3.download_file("s3://bucket/job/0_output.mp4", "/tmp/x.mp4")
+
+        client.download_file.assert_called_once()
+        args, kwargs = client.download_file.call_args
+        assert args == ("bucket", "job/0_output.mp4", "/tmp/x.mp4")
+        config = kwargs["Config"]
+        assert config.max_request_concurrency * stitch.DOWNLOAD_CONCURRENCY <= s3.IO_THREADS // 2
+
+
+class TestHeadObject:
+    @pytest.mark.parametrize("uri", ["bucket/key.png", "images/2026-07-09/a.png", ""])
+    def test_non_s3_path_is_not_found(self, monkeypatch, uri):
+        client = MagicMock()
+        monkeypatch.setattr(s3, "_get_client", lambda: client)
+
+        assert s3.head_object(uri) is None
+        client.head_object.assert_not_called()
@@ -0,0 +1,93 @@
+"""Tests for how the response schemas compile: deferred building, the startup pass that
+builds route models, the shared list adapters, nullable fields, and lazy package exports."""
+
+import subprocess
+import sys
+import uuid
+
+import pytest
+
+import app.schemas as app_schemas
+from app.main import _response_models, app, build_route_schemas
+from app.schemas.jobs import JobDetailResponse, JobResponse
+from app.schemas.loras import LoraResponse
+from app.schemas.orm import list_adapter
+from app.schemas.segments import SegmentResponse
+from app.schemas.videos import VideoResponse
+from app.schemas.wildcards import WildcardNameResponse, WildcardResponse
+
+
+class TestDeferredSchemas:
+    def test_response_models_unwraps_lists_and_unions(self):
+        tp = list[WildcardResponse] | list[WildcardNameResponse]
+        assert _response_models(tp) == {WildcardResponse, WildcardNameResponse}
+
+    def test_non_model_response_types_are_ignored(self):
+        assert _response_models(dict[str, int]) == set()
+
+    def test_startup_builds_route_response_models(self):
+        build_route_schemas(app)
+        for model in (JobDetailResponse, JobResponse, WildcardNameResponse):
+            assert model.__pydantic_complete__
+
+    def test_orm_schemas_keep_from_attributes(self):
+        # JobDetailResponse inherits its config; defer_build must not have replaced it.
+        for model in (JobDetailResponse, SegmentResponse):
+            assert model.model_config["from_attributes"] is True
+            assert model.model_config["defer_build"] is True
+
+
+class TestListAdapter:
+    def test_one_adapter_per_model(self):
+        assert list_adapter(WildcardNameResponse) is list_adapter(WildcardNameResponse)
+        assert list_adapter(WildcardNameResponse) is not list_adapter(WildcardResponse)
+
+    def test_validates_row_mappings_in_one_call(self):
+        rows = [{"id": uuid.uuid4(), "name": f"wc-{i}"} for i in range(3)]
+        items = list_adapter(WildcardNameResponse).validate_python(rows)
+        assert [type(i) for i in items] == [WildcardNameResponse] * 3
+        assert [i.name for i in items] == ["wc-0", "wc-1", "wc-2"]
+
+
+def _schema_types(schema) -> set[str]:
+    found = set()
+    if isinstance(schema, dict):
+        if isinstance(schema.get("type"), str):
+            found.add(schema["type"])
+        for value in schema.values():
+            found |= _schema_types(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            found |= _schema_types(value)
+    return found
+
+
+class TestNullableFields:
+    @pytest.mark.parametrize("model", [JobResponse, SegmentResponse, LoraResponse, VideoResponse])
+    def test_optional_fields_compile_to_nullable_not_union(self, model):
+        # Optional[X] is a single nullable check in pydantic v2, not a union that tries each
+        # member, so there is nothing to gain from union_mode or hand-rolled aliases. Pin it
+        # so a field typed as a real union shows up here rather than in a profile.
+        model.model_rebuild(force=False)
+        types = _schema_types(model.__pydantic_core_schema__)
+        assert "nullable" in types
+        assert "union" not in types
+
+
+class TestLazyPackageExports:
+    def test_importing_one_submodule_does_not_load_the_others(self):
+        code = (
+            "import sys, app.schemas.tags; "
+            "print(sorted(m for m in sys.modules if m.startswith('app.schemas.')))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "['app.schemas.tags']"
+
+    @pytest.mark.parametrize("name", app_schemas.__all__)
+    def test_every_export_resolves(self, name):
+        value = getattr(app_schemas, name)
+        assert value.__name__ == name
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            app_schemas.NoSuchSchema
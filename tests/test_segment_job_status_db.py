@@ -0,0 +1,125 @@
+"""Job status after a segment finishes, run against a real database (#162).
+
+update_segment decides the job's next status with one conditional UPDATE whose WHERE refuses
+to fire while any sibling segment is still queued or running. That rule lives entirely in SQL,
+so only real rows can show it holds.
+"""
+
+import uuid
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+from sqlalchemy import select
+
+from app.enums import JobStatus, SegmentStatus, VideoStatus
+from app.models import Job, Segment, User, Video
+from app.routes.segments import update_segment
+from app.schemas.segments import SegmentResponse, SegmentStatusUpdate
+from app.stitch import stitch_video
+
+
+async def _job(db, *statuses: str, auto_finalize: bool = False, tags: str | None = None) -> tuple[Job, list[Segment]]:
+    user = User(username=f"u-{uuid.uuid4().hex[:8]}", password_hash="x")
+    db.add(user)
+    await db.flush()
+    job = Job(user_id=user.id, name="j", width=480, height=720, fps=16, seed=1,
+              status=JobStatus.PROCESSING, tags=tags)
+    db.add(job)
+    await db.flush()
+    segments = [
+        Segment(job_id=job.id, index=i, prompt="p", status=s, auto_finalize=auto_finalize)
+        for i, s in enumerate(statuses)
+    ]
+    db.add_all(segments)
+    await db.flush()
+    return job, segments
+
+
+async def _finish(db, segment: Segment, seg_status: str) -> BackgroundTasks:
+    tasks = BackgroundTasks()
+    await update_segment(segment.id, SegmentStatusUpdate(status=seg_status), tasks, db)
+    return tasks
+
+
+async def _job_status(db, job_id) -> str:
+    return (await db.execute(select(Job.status).where(Job.id == job_id))).scalar_one()
+
+
+class TestJobStatusAfterSegment:
+    async def test_last_segment_completing_leaves_job_awaiting(self, db):
+        job, (seg,) = await _job(db, SegmentStatus.PROCESSING)
+        await _finish(db, seg, SegmentStatus.COMPLETED)
+        assert await _job_status(db, job.id) == JobStatus.AWAITING
+
+    async def test_returned_segment_serializes_without_a_refresh(self, db):
+        _job_row, (seg,) = await _job(db, SegmentStatus.PROCESSING)
+        returned = await update_segment(
+            seg.id,
+            SegmentStatusUpdate(status=SegmentStatus.COMPLETED, output_path="s3://b/k.mp4"),
+            BackgroundTasks(),
+            db,
+        )
+        response = SegmentResponse.model_validate(returned)
+        assert response.status == SegmentStatus.COMPLETED
+        assert response.output_path == "s3://b/k.mp4"
+        assert response.completed_at is not None
+
+    async def test_every_identity_field_round_trips(self, db):
+        _job_row, (seg,) = await _job(db, SegmentStatus.PROCESSING)
+        scores = dict(
+            identity_mean_cos=0.81, identity_mean_cos_ref=0.49, identity_min_cos=0.4,
+            identity_slope=-0.01, identity_frames=81, identity_no_face=2,
+            identity_face_px_p50=140.0, identity_yaw_max=33.0, identity_metrics={"v": 1},
+            identity_start_cos_ref=0.7, identity_end_cos_ref=0.5,
+        )
+        await update_segment(seg.id, SegmentStatusUpdate(**scores), BackgroundTasks(), db)
+
+        db.expunge_all()
+        stored = await db.get(Segment, seg.id)
+        assert {k: getattr(stored, k) for k in scores} == scores
+
+    async def test_completed_at_is_not_moved_by_a_repeated_terminal_patch(self, db):
+        _job_row, (seg,) = await _job(db, SegmentStatus.PROCESSING)
+        first = await _finish(db, seg, SegmentStatus.COMPLETED)
+        finished_at = (await db.get(Segment, seg.id)).completed_at
+        await _finish(db, seg, SegmentStatus.COMPLETED)
+
+        db.expunge_all()
+        assert (await db.get(Segment, seg.id)).completed_at == finished_at
+        assert first.tasks == []
+
+    async def test_unknown_segment_is_404(self, db):
+        with pytest.raises(HTTPException) as exc_info:
+            await update_segment(uuid.uuid4(), SegmentStatusUpdate(progress_log="x"), BackgroundTasks(), db)
+        assert exc_info.value.status_code == 404
+
+    async def test_failure_marks_job_failed(self, db):
+        job, (seg,) = await _job(db, SegmentStatus.PROCESSING)
+        await _finish(db, seg, SegmentStatus.FAILED)
+        assert await _job_status(db, job.id) == JobStatus.FAILED
+
+    async def test_job_untouched_while_a_sibling_is_still_active(self, db):
+        job, (seg, _pending) = await _job(db, SegmentStatus.PROCESSING, SegmentStatus.PENDING)
+        await _finish(db, seg, SegmentStatus.FAILED)
+        assert await _job_status(db, job.id) == JobStatus.PROCESSING
+
+    async def test_auto_finalize_creates_video_and_schedules_stitch(self, db):
+        job, (seg,) = await _job(db, SegmentStatus.PROCESSING, auto_finalize=True, tags="a,b")
+        tasks = await _finish(db, seg, SegmentStatus.COMPLETED)
+
+        assert await _job_status(db, job.id) == JobStatus.FINALIZED
+        video = (await db.execute(select(Video).where(Video.job_id == job.id))).scalar_one()
+        assert video.status == VideoStatus.PENDING
+        assert video.tags == "a,b"
+        assert [t.func for t in tasks.tasks] == [stitch_video]
+        assert tasks.tasks[0].args == (video.id, job.id)
+
+    async def test_auto_finalize_waits_for_active_siblings(self, db):
+        job, (seg, _claimed) = await _job(
+            db, SegmentStatus.PROCESSING, SegmentStatus.CLAIMED, auto_finalize=True,
+        )
+        tasks = await _finish(db, seg, SegmentStatus.COMPLETED)
+
+        assert await _job_status(db, job.id) == JobStatus.PROCESSING
+        assert tasks.tasks == []
+        assert (await db.execute(select(Video).where(Video.job_id == job.id))).first() is None
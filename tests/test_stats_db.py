@@ -0,0 +1,83 @@
+"""GET /stats aggregates against a real database (#162).
+
+Status counts and the windowed run-time average come out of one grouped query, so these pin
+that each number only sees the rows it should: the caller's, and for the average, completed
+runs inside the window.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from app.enums import JobStatus, SegmentStatus
+from app.models import Job, Segment, User
+from app.routes.jobs import STATS_WINDOW_HOURS, get_stats
+
+
+async def _user_with_job(db, job_status: str = JobStatus.AWAITING) -> tuple[User, Job]:
+    user = User(username=f"u-{uuid.uuid4().hex[:8]}", password_hash="x")
+    db.add(user)
+    await db.flush()
+    job = Job(user_id=user.id, name="j", width=480, height=720, fps=16, seed=1, status=job_status)
+    db.add(job)
+    await db.flush()
+    return user, job
+
+
+def _segment(job: Job, index: int, seg_status: str, run_seconds: float | None = None,
+             finished_ago: timedelta = timedelta(minutes=5), worker: str | None = None) -> Segment:
+    completed_at = claimed_at = None
+    if run_seconds is not None:
+        completed_at = datetime.now(timezone.utc) - finished_ago
+        claimed_at = completed_at - timedelta(seconds=run_seconds)
+    return Segment(job_id=job.id, index=index, prompt="p", status=seg_status,
+                   claimed_at=claimed_at, completed_at=completed_at, worker_name=worker)
+
+
+class TestStats:
+    async def test_counts_and_windowed_average(self, db):
+        user, job = await _user_with_job(db)
+        db.add_all([
+            _segment(job, 0, SegmentStatus.COMPLETED, 100, worker="w1"),
+            _segment(job, 1, SegmentStatus.COMPLETED, 200, worker="w1"),
+            # Outside the window: counted, but not in the average.
+            _segment(job, 2, SegmentStatus.COMPLETED, 900,
+                     finished_ago=timedelta(hours=STATS_WINDOW_HOURS + 1), worker="w1"),
+            # Failed runs have timestamps too; they must not leak into the average.
+            _segment(job, 3, SegmentStatus.FAILED, 5),
+        ])
+        _other_user, other_job = await _user_with_job(db)
+        db.add(_segment(other_job, 0, SegmentStatus.COMPLETED, 1))
+        await db.flush()
+
+        stats = await get_stats(user, db)
+
+        assert stats.jobs_by_status == {JobStatus.AWAITING: 1}
+        assert stats.segments_by_status == {SegmentStatus.COMPLETED: 3, SegmentStatus.FAILED: 1}
+        assert stats.avg_segment_run_time_24h == 150.0
+        assert [(w.worker_name, w.segments_completed) for w in stats.worker_stats] == [("w1", 3)]
+
+    async def test_no_completed_runs_means_no_average(self, db):
+        user, job = await _user_with_job(db)
+        db.add(_segment(job, 0, SegmentStatus.FAILED, 5))
+        await db.flush()
+
+        stats = await get_stats(user, db)
+
+        assert stats.segments_by_status == {SegmentStatus.FAILED: 1}
+        assert stats.avg_segment_run_time_24h is None
+
+    async def test_worker_averages_are_per_worker(self, db):
+        user, job = await _user_with_job(db)
+        db.add_all([
+            _segment(job, 0, SegmentStatus.COMPLETED, 100, worker="w1"),
+            _segment(job, 1, SegmentStatus.COMPLETED, 300, worker="w1"),
+            _segment(job, 2, SegmentStatus.COMPLETED, 40, worker="w2"),
+            # Unattributed runs have no worker to report against.
+            _segment(job, 3, SegmentStatus.COMPLETED, 1000),
+        ])
+        await db.flush()
+
+        stats = await get_stats(user, db)
+
+        by_worker = {w.worker_name: (w.segments_completed, w.avg_run_time) for w in stats.worker_stats}
+        assert by_worker == {"w1": (2, 200.0), "w2": (1, 40.0)}
@@ -0,0 +1,124 @@
+"""Unit tests for the stitch pipeline helpers in app/stitch.py.
+
+S3 and ffmpeg are replaced with fakes; these cover the orchestration around them.
+"""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app import stitch
+
+
+def _segments(n: int) -> list:
+    return [SimpleNamespace(index=i, output_path=f"s3://jobs/j/{i}.mp4") for i in range(n)]
+
+
+class TestDownloadSegments:
+    @pytest.mark.asyncio
+    async def test_files_come_back_in_segment_order(self, monkeypatch, tmp_path):
+        def fake_download(uri: str, local_path: str) -> None:
+            # Later segments finish first.
+            time.sleep(0.01 * (5 - int(uri.rsplit("/", 1)[1].split(".")[0])))
+            Path(local_path).write_text(uri)
+
+        monkeypatch.setattr(stitch, "download_file", fake_download)
+        names = await stitch._download_segments(_segments(5), tmp_path)
+
+        assert names == [f"seg_{i:03d}.mp4" for i in range(5)]
+        assert [(tmp_path / n).read_text() for n in names] == [f"s3://jobs/j/{i}.mp4" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, monkeypatch, tmp_path):
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def fake_download(uri: str, local_path: str) -> None:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+
+        monkeypatch.setattr(stitch, "download_file", fake_download)
+        await stitch._download_segments(_segments(stitch.DOWNLOAD_CONCURRENCY * 2), tmp_path)
+
+        assert 1 < peak <= stitch.DOWNLOAD_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_no_queued_download_starts_after_a_failure(self, monkeypatch, tmp_path):
+        lock = threading.Lock()
+        started, running = [], 0
+
+        def fake_download(uri: str, local_path: str) -> None:
+            nonlocal running
+            with lock:
+                started.append(uri)
+                running += 1
+            try:
+                if uri.endswith("/0.mp4"):
+                    raise RuntimeError("NoSuchKey")
+                time.sleep(0.02)
+            finally:
+                with lock:
+                    running -= 1
+
+        monkeypatch.setattr(stitch, "download_file", fake_download)
+        with pytest.raises(RuntimeError, match="NoSuchKey"):
+            await stitch._download_segments(_segments(24), tmp_path)
+
+        # Only the first batch ever started, and none was still running when the error surfaced.
+        assert len(started) <= stitch.DOWNLOAD_CONCURRENCY
+        assert running == 0
+
+    @pytest.mark.asyncio
+    async def test_a_failed_download_propagates(self, monkeypatch, tmp_path):
+        def fake_download(uri: str, local_path: str) -> None:
+            if uri.endswith("/2.mp4"):
+                raise RuntimeError("NoSuchKey")
+
+        monkeypatch.setattr(stitch, "download_file", fake_download)
+        with pytest.raises(RuntimeError, match="NoSuchKey"):
+            await stitch._download_segments(_segments(4), tmp_path)
+
+
+class TestConcatCopy:
+    @staticmethod
+    def _fake_ffmpeg(monkeypatch, returncode: int = 0, stderr: bytes = b""):
+        calls = []
+
+        def run(cmd, **kwargs):
+            calls.append((cmd, kwargs))
+            return subprocess.CompletedProcess(cmd, returncode, stdout=b"", stderr=stderr)
+
+        monkeypatch.setattr(stitch.subprocess, "run", run)
+        return calls
+
+    def test_writes_a_faststart_mp4_to_the_output_path(self, monkeypatch, tmp_path):
+        calls = self._fake_ffmpeg(monkeypatch)
+        output = tmp_path / "final.mp4"
+
+        result = stitch._concat_copy(tmp_path, ["seg_000.mp4", "black_000.mp4", "seg_001.mp4"], output)
+
+        assert result == output
+        cmd, kwargs = calls[0]
+        assert cmd[cmd.index("-c") + 1] == "copy"
+        assert cmd[cmd.index("-movflags") + 1] == "+faststart"
+        assert cmd[-1] == str(output)
+        assert "pipe:1" not in cmd
+        assert kwargs["timeout"] == 300
+        assert (tmp_path / "concat.txt").read_text().splitlines() == [
+            "file 'seg_000.mp4'", "file 'black_000.mp4'", "file 'seg_001.mp4'",
+        ]
+
+    def test_ffmpeg_failure_raises_with_its_stderr(self, monkeypatch, tmp_path):
+        self._fake_ffmpeg(monkeypatch, returncode=1, stderr=b"bad input")
+
+        with pytest.raises(RuntimeError, match="bad input"):
+            stitch._concat_copy(tmp_path, ["a.mp4", "b.mp4"], tmp_path / "final.mp4")
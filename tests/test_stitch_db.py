@@ -0,0 +1,178 @@
+"""stitch_video end to end against a real database, with S3 and ffmpeg faked (#162).
+
+The task loads its job, video and completed segments itself and records success or failure
+on those rows, so what matters here is which rows it picks up and what it leaves behind.
+"""
+
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from app import stitch
+from app.enums import JobStatus, SegmentStatus, VideoStatus
+from app.models import Job, Segment, User, Video
+
+
+async def _job(db, *statuses: str) -> tuple[Job, Video]:
+    user = User(username=f"u-{uuid.uuid4().hex[:8]}", password_hash="x")
+    db.add(user)
+    await db.flush()
+    job = Job(user_id=user.id, name="j", width=480, height=720, fps=16, seed=1,
+              status=JobStatus.FINALIZED)
+    db.add(job)
+    await db.flush()
+    db.add_all([
+        Segment(job_id=job.id, index=i, prompt="p", status=s, duration_seconds=5.0,
+                output_path=f"s3://jobs/{job.id}/{i}.mp4" if s == SegmentStatus.COMPLETED else None)
+        for i, s in enumerate(statuses)
+    ])
+    video = Video(job_id=job.id)
+    db.add(video)
+    await db.flush()
+    return job, video
+
+
+def _use_session(monkeypatch, db):
+    @asynccontextmanager
+    async def session():
+        yield db
+
+    monkeypatch.setattr(stitch, "async_session", session)
+
+
+def _fake_upload(monkeypatch) -> list[str]:
+    uploaded = []
+
+    def upload_file(path, key, bucket):
+        uploaded.append(Path(path).name)
+        return f"s3://{bucket}/{key}"
+
+    monkeypatch.setattr(stitch, "upload_file", upload_file)
+    return uploaded
+
+
+async def _reload(db, job: Job, video: Video) -> tuple[Job, Video]:
+    db.expunge_all()
+    return await db.get(Job, job.id), await db.get(Video, video.id)
+
+
+class TestStitchVideo:
+    async def test_stitches_only_completed_segments_in_order(self, db, monkeypatch):
+        job, video = await _job(db, SegmentStatus.COMPLETED, SegmentStatus.FAILED, SegmentStatus.COMPLETED)
+        _use_session(monkeypatch, db)
+        downloaded, joined = [], []
+        monkeypatch.setattr(stitch, "download_file", lambda uri, path: downloaded.append(uri))
+
+        def concat_copy(tmppath, names, output_path):
+            joined.extend(names)
+            return output_path
+
+        monkeypatch.setattr(stitch, "_concat_copy", concat_copy)
+        uploaded = _fake_upload(monkeypatch)
+
+        await stitch.stitch_video(video.id, job.id)
+
+        job, video = await _reload(db, job, video)
+        assert sorted(downloaded) == [f"s3://jobs/{job.id}/0.mp4", f"s3://jobs/{job.id}/2.mp4"]
+        assert joined == ["seg_000.mp4", "seg_002.mp4"]
+        assert uploaded == ["final.mp4"]
+        assert video.status == VideoStatus.COMPLETED
+        assert video.output_path.endswith(f"/{job.id}/final.mp4")
+        assert video.duration_seconds == 10.0
+        assert job.status == JobStatus.FINALIZED
+
+    async def test_failure_is_recorded_on_the_video(self, db, monkeypatch):
+        job, video = await _job(db, SegmentStatus.COMPLETED)
+        _use_session(monkeypatch, db)
+
+        def download_file(uri, path):
+            raise RuntimeError("NoSuchKey")
+
+        monkeypatch.setattr(stitch, "download_file", download_file)
+
+        await stitch.stitch_video(video.id, job.id)
+
+        job, video = await _reload(db, job, video)
+        assert video.status == VideoStatus.FAILED
+        assert "NoSuchKey" in video.error_message
+        assert job.status == JobStatus.FINALIZED
+
+    async def test_no_completed_segments_fails_the_video(self, db, monkeypatch):
+        job, video = await _job(db, SegmentStatus.FAILED)
+        _use_session(monkeypatch, db)
+
+        await stitch.stitch_video(video.id, job.id)
+
+        _job_row, video = await _reload(db, job, video)
+        assert video.status == VideoStatus.FAILED
+        assert video.error_message == "No completed segments to stitch"
+
+    async def test_video_of_another_job_is_not_touched(self, db, monkeypatch):
+        job, _video = await _job(db, SegmentStatus.COMPLETED)
+        _other_job, other_video = await _job(db, SegmentStatus.COMPLETED)
+        _use_session(monkeypatch, db)
+
+        await stitch.stitch_video(other_video.id, job.id)
+
+        db.expunge_all()
+        assert (await db.get(Video, other_video.id)).status == VideoStatus.PENDING
+        assert (await db.execute(select(Job.status).where(Job.id == job.id))).scalar_one() == JobStatus.FINALIZED
+
+    async def test_missing_output_is_reported_before_any_download(self, db, monkeypatch):
+        job, video = await _job(db, SegmentStatus.COMPLETED, SegmentStatus.COMPLETED, SegmentStatus.COMPLETED)
+        seg = (await db.execute(select(Segment).where(Segment.job_id == job.id, Segment.index == 1))).scalar_one()
+        seg.output_path = None
+        await db.flush()
+        _use_session(monkeypatch, db)
+        monkeypatch.setattr(stitch, "download_file", lambda uri, path: pytest.fail("downloaded"))
+
+        await stitch.stitch_video(video.id, job.id)
+
+        _job_row, video = await _reload(db, job, video)
+        assert video.status == VideoStatus.FAILED
+        assert video.error_message == "Segments missing output_path: [1]"
+
+    async def test_vace_overlap_trims_the_previous_segment(self, db, monkeypatch):
+        job, video = await _job(db, SegmentStatus.COMPLETED, SegmentStatus.COMPLETED)
+        seg = (await db.execute(select(Segment).where(Segment.job_id == job.id, Segment.index == 1))).scalar_one()
+        seg.vace_overlap_seconds = 0.5
+        await db.flush()
+        _use_session(monkeypatch, db)
+        trims = []
+
+        def apply_trim(src, dst, fps, start_frames, end_frames):
+            trims.append((Path(src).name, start_frames, end_frames))
+            return 4.5
+
+        monkeypatch.setattr(stitch, "download_file", lambda uri, path: None)
+        monkeypatch.setattr(stitch, "_apply_trim", apply_trim)
+        monkeypatch.setattr(stitch, "_concat_copy", lambda tmppath, names, output_path: output_path)
+        _fake_upload(monkeypatch)
+
+        await stitch.stitch_video(video.id, job.id)
+
+        _job_row, video = await _reload(db, job, video)
+        assert trims == [("seg_000.mp4", 0, 8)]
+        # Trimmed first segment plus the second at its intended length and its 0.5s lead-in.
+        assert video.duration_seconds == 4.5 + 5.5
+
+    async def test_failed_concat_never_touches_s3(self, db, monkeypatch):
+        job, video = await _job(db, SegmentStatus.COMPLETED, SegmentStatus.COMPLETED)
+        _use_session(monkeypatch, db)
+        monkeypatch.setattr(stitch, "download_file", lambda uri, path: None)
+
+        def concat_copy(tmppath, names, output_path):
+            raise RuntimeError("ffmpeg failed: bad input")
+
+        monkeypatch.setattr(stitch, "_concat_copy", concat_copy)
+        uploaded = _fake_upload(monkeypatch)
+
+        await stitch.stitch_video(video.id, job.id)
+
+        _job_row, video = await _reload(db, job, video)
+        assert uploaded == []
+        assert video.status == VideoStatus.FAILED
+        assert "bad input" in video.error_message
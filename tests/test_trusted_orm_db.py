@@ -0,0 +1,90 @@
+"""from_orm_trusted must produce the same response as model_validate for rows read back (#162).
+
+It skips validation, so a drift between a schema and its model (a renamed column, a computed
+field that suddenly gains an ORM attribute) would not raise - it would just serialize wrong.
+Comparing the dumps of both paths on real rows is what catches that.
+"""
+
+import uuid
+
+from app.models import Job, Lora, Segment, User, Video
+from app.schemas.jobs import JobResponse
+from app.schemas.loras import LoraListItem, LoraResponse
+from app.schemas.orm import TrustedORMModel
+from app.schemas.segments import SegmentResponse
+from app.schemas.videos import VideoResponse
+
+
+class _JobWithSegments(TrustedORMModel):
+    """A schema with a relationship field, like JobDetailResponse."""
+
+    id: uuid.UUID
+    name: str
+    segments: list[SegmentResponse] = []
+
+
+async def _rows(db):
+    user = User(username=f"u-{uuid.uuid4().hex[:8]}", password_hash="x")
+    db.add(user)
+    await db.flush()
+    job = Job(user_id=user.id, name="j", width=480, height=720, fps=16, seed=1, tags="a")
+    lora = Lora(name=f"l-{uuid.uuid4().hex[:8]}", high_file="h.safetensors")
+    db.add_all([job, lora])
+    await db.flush()
+    segment = Segment(job_id=job.id, index=0, prompt="p", loras=[{"high_file": "h.safetensors"}],
+                      identity_metrics={"v": 1})
+    video = Video(job_id=job.id)
+    db.add_all([segment, video])
+    await db.flush()
+    db.expunge_all()
+    return [await db.get(type(o), o.id) for o in (job, segment, video, lora)]
+
+
+class TestFromOrmTrusted:
+    async def test_matches_model_validate(self, db):
+        job, segment, video, lora = await _rows(db)
+        for schema, row in [
+            (JobResponse, job),
+            (SegmentResponse, segment),
+            (VideoResponse, video),
+            (LoraResponse, lora),
+            (LoraListItem, lora),
+        ]:
+            trusted = schema.from_orm_trusted(row)
+            assert trusted.model_dump(mode="json") == schema.model_validate(row).model_dump(mode="json")
+
+    async def test_fields_missing_on_the_row_take_schema_defaults(self, db):
+        job, segment, _video, _lora = await _rows(db)
+        assert JobResponse.from_orm_trusted(job).segment_count == 0
+        assert JobResponse.from_orm_trusted(job).loras == []
+        assert SegmentResponse.from_orm_trusted(segment).estimated_run_time is None
+
+    async def test_getter_is_built_once_per_source_class(self, db):
+        _job, segment, _video, _lora = await _rows(db)
+        SegmentResponse.__orm_getters__.pop(type(segment), None)
+        SegmentResponse.from_orm_trusted(segment)
+        names, getter = SegmentResponse.__orm_getters__[type(segment)]
+        SegmentResponse.from_orm_trusted(segment)
+
+        assert SegmentResponse.__orm_getters__[type(segment)][1] is getter
+        assert "estimated_run_time" not in names
+        # Each subclass keeps its own cache.
+        assert type(segment) not in VideoResponse.__orm_getters__
+
+    async def test_unloaded_relationship_field_is_never_read(self, db):
+        job, segment, _video, _lora = await _rows(db)
+        # Job.segments is lazy and was not loaded: touching it here would raise MissingGreenlet.
+        built = _JobWithSegments.from_orm_trusted(job)
+
+        assert built.name == "j"
+        assert built.segments == []
+        assert "segments" not in _JobWithSegments.__orm_getters__[Job][0]
+
+    async def test_relationship_fields_are_passed_explicitly(self, db):
+        job, segment, _video, _lora = await _rows(db)
+        segments = [SegmentResponse.from_orm_trusted(segment)]
+
+        built = _JobWithSegments.from_orm_trusted(job, segments=segments)
+
+        assert built.segments == segments
+        assert built.model_dump(mode="json")["segments"][0]["id"] == str(segment.id)
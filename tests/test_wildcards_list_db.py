@@ -0,0 +1,99 @@
+"""GET /wildcards paging and the names-only projection, against a real database (#162).
+
+The response model is a union of the full and slim shapes, so these go through the HTTP layer:
+the thing that can break is FastAPI serializing one shape as the other. Writes are covered for
+the one side effect they have beyond the row: clearing the prompt resolver's wildcard cache.
+"""
+
+import uuid
+
+import pytest
+from pydantic import ValidationError
+from httpx import ASGITransport, AsyncClient
+
+from app import wildcard_cache
+from app.auth import get_current_user
+from app.database import get_db
+from app.main import app
+from app.models import User, Wildcard
+from app.schemas.wildcards import WildcardNameResponse
+from app.routes.segments import _resolve_wildcards
+
+_fake_user = User(id=uuid.uuid4(), username="testuser", password_hash="x")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_wildcard_cache():
+    """The resolver cache outlives the rolled-back rows; keep it from leaking between tests."""
+    wildcard_cache.clear()
+    yield
+    wildcard_cache.clear()
+
+
+@pytest.fixture
+async def client(db):
+    db.add_all([Wildcard(name=f"wc-{i}", options=[f"opt-{i}"]) for i in range(3)])
+    await db.flush()
+    app.dependency_overrides[get_current_user] = lambda: _fake_user
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+
+
+class TestListWildcards:
+    async def test_full_rows_include_options(self, client):
+        resp = await client.get("/wildcards")
+        assert resp.status_code == 200
+        assert [w["name"] for w in resp.json()] == ["wc-0", "wc-1", "wc-2"]
+        assert resp.json()[0]["options"] == ["opt-0"]
+
+    async def test_names_only_omits_options(self, client):
+        resp = await client.get("/wildcards", params={"names_only": True})
+        assert resp.status_code == 200
+        assert [set(w) for w in resp.json()] == [{"id", "name"}] * 3
+
+    async def test_limit_and_offset_page_in_name_order(self, client):
+        resp = await client.get("/wildcards", params={"limit": 1, "offset": 1})
+        assert [w["name"] for w in resp.json()] == ["wc-1"]
+
+    async def test_no_limit_returns_every_row(self, client, db):
+        db.add_all([Wildcard(name=f"wc-more-{i:03d}", options=[]) for i in range(150)])
+        await db.flush()
+
+        full = await client.get("/wildcards")
+        names = await client.get("/wildcards", params={"names_only": True})
+
+        assert len(full.json()) == len(names.json()) == 153
+
+    @pytest.mark.parametrize("limit", [0, 1001])
+    async def test_limit_is_bounded(self, client, limit):
+        resp = await client.get("/wildcards", params={"limit": limit})
+        assert resp.status_code == 422
+
+
+class TestWildcardWritesClearResolverCache:
+    async def test_edit_is_seen_by_the_next_prompt(self, client, db):
+        assert (await _resolve_wildcards(db, "<wc-0>"))[0] == "opt-0"
+        wc = (await client.get("/wildcards", params={"limit": 1})).json()[0]
+
+        resp = await client.patch(f"/wildcards/{wc['id']}", json={"options": ["edited"]})
+
+        assert resp.status_code == 200
+        assert (await _resolve_wildcards(db, "<wc-0>"))[0] == "edited"
+
+    async def test_delete_is_seen_by_the_next_prompt(self, client, db):
+        assert (await _resolve_wildcards(db, "<wc-1>"))[0] == "opt-1"
+        wc = (await client.get("/wildcards", params={"limit": 1, "offset": 1})).json()[0]
+
+        assert (await client.delete(f"/wildcards/{wc['id']}")).status_code == 204
+        assert (await _resolve_wildcards(db, "<wc-1>"))[0] == "<wc-1>"
+
+
+class TestWildcardListShapes:
+    def test_a_full_row_never_validates_as_the_slim_shape(self):
+        row = Wildcard(id=uuid.uuid4(), name="wc", options=["a"])
+        with pytest.raises(ValidationError):
+            WildcardNameResponse.model_validate(row)